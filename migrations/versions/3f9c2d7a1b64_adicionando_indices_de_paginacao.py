@@ -0,0 +1,44 @@
+"""adicionando indices de paginacao
+
+Revision ID: 3f9c2d7a1b64
+Revises: a7b682f5ede5
+Create Date: 2026-10-18 14:55:12.318204
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2d7a1b64'
+down_revision: Union[str, Sequence[str], None] = 'a7b682f5ede5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Indices compostos para paginação por cursor em (created_at, id)
+    op.create_index(
+        'ix_task_user_id_created_at_id',
+        'task',
+        ['user_id', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_habit_user_id_created_at_id',
+        'habit',
+        ['user_id', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_project_user_id_created_at_id',
+        'project',
+        ['user_id', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_project_user_id_created_at_id', table_name='project')
+    op.drop_index('ix_habit_user_id_created_at_id', table_name='habit')
+    op.drop_index('ix_task_user_id_created_at_id', table_name='task')
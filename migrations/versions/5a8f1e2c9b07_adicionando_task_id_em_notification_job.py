@@ -0,0 +1,49 @@
+"""adicionando task_id em notification_job
+
+Revision ID: 5a8f1e2c9b07
+Revises: e07b3c9d5a21
+Create Date: 2026-10-18 17:48:09.771352
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8f1e2c9b07'
+down_revision: Union[str, Sequence[str], None] = 'e07b3c9d5a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Jobs criados antes desta revisão ficam sem task_id e ainda disparam
+    # uma vez; os novos são únicos por task.
+    op.add_column(
+        'notification_job', sa.Column('task_id', sa.UUID(), nullable=True)
+    )
+    op.create_foreign_key(
+        'notification_job_task_id_fkey',
+        'notification_job',
+        'task',
+        ['task_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_index(
+        'ix_notification_job_task_id',
+        'notification_job',
+        ['task_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notification_job_task_id', table_name='notification_job')
+    op.drop_constraint(
+        'notification_job_task_id_fkey', 'notification_job', type_='foreignkey'
+    )
+    op.drop_column('notification_job', 'task_id')
@@ -0,0 +1,42 @@
+"""adicionando indices por usuario
+
+Revision ID: 8d41e6b0c2f3
+Revises: 3f9c2d7a1b64
+Create Date: 2026-10-18 15:02:47.906115
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41e6b0c2f3'
+down_revision: Union[str, Sequence[str], None] = '3f9c2d7a1b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (user_id, created_at) em task, habit e project já é coberto pelos
+    # índices de paginação (user_id, created_at, id) da revisão anterior,
+    # que também atendem filtros só por user_id.
+    op.create_index(
+        'ix_task_user_id_project_id', 'task', ['user_id', 'project_id']
+    )
+    op.create_index(
+        'ix_task_user_id_parent_task_id',
+        'task',
+        ['user_id', 'parent_task_id'],
+    )
+    op.create_index(
+        'ix_task_user_id_due_date', 'task', ['user_id', 'due_date']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_user_id_due_date', table_name='task')
+    op.drop_index('ix_task_user_id_parent_task_id', table_name='task')
+    op.drop_index('ix_task_user_id_project_id', table_name='task')
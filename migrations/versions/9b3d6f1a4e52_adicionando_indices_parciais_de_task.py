@@ -0,0 +1,47 @@
+"""adicionando indices parciais de task
+
+Revision ID: 9b3d6f1a4e52
+Revises: 5a8f1e2c9b07
+Create Date: 2026-10-18 18:31:26.047719
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3d6f1a4e52'
+down_revision: Union[str, Sequence[str], None] = '5a8f1e2c9b07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tasks abertas por prazo: o filtro e a ordenação mais usados
+    op.create_index(
+        'ix_task_open_user_id_due_date_id',
+        'task',
+        ['user_id', 'due_date', 'id'],
+        postgresql_where=sa.text('status = false'),
+    )
+    op.create_index(
+        'ix_task_focus_user_id_created_at_id',
+        'task',
+        ['user_id', 'created_at', 'id'],
+        postgresql_where=sa.text('is_focus = true'),
+    )
+    op.create_index(
+        'ix_task_scheduled_user_id_start_id',
+        'task',
+        ['user_id', 'scheduled_start_time', 'id'],
+        postgresql_where=sa.text('scheduled_start_time IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_scheduled_user_id_start_id', table_name='task')
+    op.drop_index('ix_task_focus_user_id_created_at_id', table_name='task')
+    op.drop_index('ix_task_open_user_id_due_date_id', table_name='task')
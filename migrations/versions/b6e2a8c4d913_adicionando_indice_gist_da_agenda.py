@@ -0,0 +1,42 @@
+"""adicionando indice gist da agenda
+
+Revision ID: b6e2a8c4d913
+Revises: 9b3d6f1a4e52
+Create Date: 2026-10-18 19:12:53.381946
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2a8c4d913'
+down_revision: Union[str, Sequence[str], None] = '9b3d6f1a4e52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # btree_gist permite user_id (igualdade) no mesmo índice GiST do range
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    # tsrange falha com fim antes do início, por isso o predicado parcial
+    op.create_index(
+        'ix_task_user_id_scheduled_range',
+        'task',
+        [
+            'user_id',
+            sa.text('tsrange(scheduled_start_time, scheduled_end_time)'),
+        ],
+        postgresql_using='gist',
+        postgresql_where=sa.text(
+            'scheduled_start_time IS NOT NULL '
+            'AND scheduled_end_time >= scheduled_start_time'
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_user_id_scheduled_range', table_name='task')
@@ -0,0 +1,54 @@
+"""criando tabela notification_outbox
+
+Revision ID: c52e9a4f7d18
+Revises: 8d41e6b0c2f3
+Create Date: 2026-10-18 16:20:31.504872
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52e9a4f7d18'
+down_revision: Union[str, Sequence[str], None] = '8d41e6b0c2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'notification_outbox',
+        sa.Column('task_id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('task_title', sa.String(), nullable=False),
+        sa.Column('due_date', sa.DateTime(), nullable=False),
+        sa.Column('notify_at', sa.Interval(), nullable=False),
+        sa.Column(
+            'attempts', sa.Integer(), server_default='0', nullable=False
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(['task_id'], ['task.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_notification_outbox_created_at',
+        'notification_outbox',
+        ['created_at'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_notification_outbox_created_at', table_name='notification_outbox'
+    )
+    op.drop_table('notification_outbox')
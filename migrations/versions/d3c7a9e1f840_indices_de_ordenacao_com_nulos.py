@@ -0,0 +1,52 @@
+"""indices de ordenacao com nulos
+
+Revision ID: d3c7a9e1f840
+Revises: b6e2a8c4d913
+Create Date: 2026-10-19 10:04:12.518307
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3c7a9e1f840'
+down_revision: Union[str, Sequence[str], None] = 'b6e2a8c4d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # As páginas por prazo/início são a união de duas faixas de índice:
+    # os valores preenchidos por (coluna, id) e os nulos apenas por id
+    op.create_index(
+        'ix_task_user_id_due_date_id',
+        'task',
+        ['user_id', 'due_date', 'id'],
+    )
+    op.create_index(
+        'ix_task_undated_user_id_id',
+        'task',
+        ['user_id', 'id'],
+        postgresql_where=sa.text('due_date IS NULL'),
+    )
+    op.create_index(
+        'ix_task_unscheduled_user_id_id',
+        'task',
+        ['user_id', 'id'],
+        postgresql_where=sa.text('scheduled_start_time IS NULL'),
+    )
+    op.drop_index('ix_task_user_id_due_date', table_name='task')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_task_user_id_due_date', 'task', ['user_id', 'due_date']
+    )
+    op.drop_index('ix_task_unscheduled_user_id_id', table_name='task')
+    op.drop_index('ix_task_undated_user_id_id', table_name='task')
+    op.drop_index('ix_task_user_id_due_date_id', table_name='task')
@@ -0,0 +1,41 @@
+"""criando tabela notification_job
+
+Revision ID: e07b3c9d5a21
+Revises: c52e9a4f7d18
+Create Date: 2026-10-18 17:05:44.219630
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e07b3c9d5a21'
+down_revision: Union[str, Sequence[str], None] = 'c52e9a4f7d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'notification_job',
+        sa.Column('next_run_time', sa.DateTime(), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_notification_job_next_run_time',
+        'notification_job',
+        ['next_run_time'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_notification_job_next_run_time', table_name='notification_job'
+    )
+    op.drop_table('notification_job')
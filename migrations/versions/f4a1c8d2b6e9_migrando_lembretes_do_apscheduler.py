@@ -0,0 +1,54 @@
+"""migrando lembretes do apscheduler
+
+Revision ID: f4a1c8d2b6e9
+Revises: d3c7a9e1f840
+Create Date: 2026-10-19 11:26:47.903154
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a1c8d2b6e9'
+down_revision: Union[str, Sequence[str], None] = 'd3c7a9e1f840'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Os lembretes pendentes estavam serializados com pickle em
+    # apscheduler_jobs. Como no `task reconcile`, cada task pendente sem job
+    # em dia entra na outbox, que resolve o e-mail e cria o notification_job
+    op.execute(
+        """
+        INSERT INTO notification_outbox
+            (id, task_id, user_id, task_title, due_date, notify_at)
+        SELECT gen_random_uuid(), task.id, task.user_id, task.title,
+               task.due_date, task.notify_at
+        FROM task
+        WHERE task.status IS false
+          AND task.due_date - task.notify_at > LOCALTIMESTAMP
+          AND NOT EXISTS (
+              SELECT 1 FROM notification_job
+              WHERE notification_job.task_id = task.id
+                AND notification_job.next_run_time
+                    = task.due_date - task.notify_at
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM notification_outbox
+              WHERE notification_outbox.task_id = task.id
+          )
+        """
+    )
+    # Criada pelo próprio APScheduler, fora das migrações
+    op.execute('DROP TABLE IF EXISTS apscheduler_jobs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # O SQLAlchemyJobStore recria apscheduler_jobs ao iniciar; os lembretes
+    # seguem em notification_job e podem ser reagendados a partir das tasks
+    pass
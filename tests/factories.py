@@ -0,0 +1,51 @@
+from timebeing_backend.models.habit import Habit
+from timebeing_backend.models.project import Project, ProjectStatus
+from timebeing_backend.models.task import Task, TaskPriorityState
+
+USER_ID = 'user_test'
+
+
+def make_task(**values) -> Task:
+    fields = {
+        'title': 'Task',
+        'description': None,
+        'due_date': None,
+        'notify_at': None,
+        'scheduled_start_time': None,
+        'scheduled_end_time': None,
+        'priority': TaskPriorityState.baixa,
+        'duration_estimate_blocks': None,
+        'location_text': None,
+        'location_lat': None,
+        'location_lon': None,
+        'ai_context_text': None,
+        'parent_task_id': None,
+        'project_id': None,
+        'user_id': USER_ID,
+    }
+    fields.update(values)
+    return Task(**fields)
+
+
+def make_project(**values) -> Project:
+    fields = {
+        'title': 'Project',
+        'description': None,
+        'status': ProjectStatus.criado,
+        'ai_context_text': None,
+        'user_id': USER_ID,
+    }
+    fields.update(values)
+    return Project(**fields)
+
+
+def make_habit(**values) -> Habit:
+    fields = {
+        'title': 'Habit',
+        'description': None,
+        'current_score': None,
+        'ai_context_prompt': None,
+        'user_id': USER_ID,
+    }
+    fields.update(values)
+    return Habit(**fields)
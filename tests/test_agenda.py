@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+
+
+def _length(interval: dict) -> timedelta:
+    return datetime.fromisoformat(interval['end']) - datetime.fromisoformat(
+        interval['start']
+    )
+
+
+@pytest.mark.asyncio
+async def test_agenda_window_matches_aware_schedules(db_timezone, client):
+    response = await client.post(
+        '/api/v1/tasks/',
+        json={
+            'title': 'Bloco',
+            'scheduled_start_time': '2026-11-20T09:00:00-03:00',
+            'scheduled_end_time': '2026-11-20T10:00:00-03:00',
+        },
+    )
+    assert response.status_code == HTTPStatus.CREATED
+
+    # The same instants, written with another offset
+    response = await client.get(
+        '/api/v1/tasks/agenda',
+        params={
+            'from': '2026-11-20T12:30:00+00:00',
+            'to': '2026-11-20T14:00:00+00:00',
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    agenda = response.json()
+    busy, free = agenda['busy'], agenda['free']
+    assert [task['title'] for task in agenda['tasks']] == ['Bloco']
+    assert len(busy) == len(free) == 1
+    # Busy until the task ends at 13:00 UTC, free for the rest
+    assert busy[0]['end'] == free[0]['start']
+    assert _length(busy[0]) == timedelta(minutes=30)
+    assert _length(free[0]) == timedelta(hours=1)
+
+
+@pytest.mark.asyncio
+async def test_agenda_rejects_an_empty_window(client):
+    response = await client.get(
+        '/api/v1/tasks/agenda',
+        params={
+            'from': '2026-11-20T12:00:00+00:00',
+            'to': '2026-11-20T09:00:00-03:00',
+        },
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Invalid range'}
+
+
+@pytest.mark.asyncio
+async def test_a_start_without_an_end_is_a_zero_length_interval(client):
+    for title, start in [
+        ('Ligação', '2026-11-20T09:30:00+00:00'),
+        ('Fora da janela', '2026-11-20T11:00:00+00:00'),
+    ]:
+        response = await client.post(
+            '/api/v1/tasks/',
+            json={'title': title, 'scheduled_start_time': start},
+        )
+        assert response.status_code == HTTPStatus.CREATED
+
+    response = await client.get(
+        '/api/v1/tasks/agenda',
+        params={
+            'from': '2026-11-20T09:00:00+00:00',
+            'to': '2026-11-20T11:00:00+00:00',
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    agenda = response.json()
+    assert [task['title'] for task in agenda['tasks']] == ['Ligação']
+    assert not agenda['busy']
+    assert [_length(interval) for interval in agenda['free']] == [
+        timedelta(hours=2)
+    ]
+
+    # Nothing to overlap, so a block around it does not conflict
+    response = await client.post(
+        '/api/v1/tasks/',
+        params={'check_conflicts': 'true'},
+        json={
+            'title': 'Bloco',
+            'scheduled_start_time': '2026-11-20T09:00:00+00:00',
+            'scheduled_end_time': '2026-11-20T10:00:00+00:00',
+        },
+    )
+    assert response.status_code == HTTPStatus.CREATED
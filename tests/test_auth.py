@@ -0,0 +1,112 @@
+import time
+from http import HTTPStatus
+from types import SimpleNamespace
+
+import jwt
+import pytest
+import pytest_asyncio
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from httpx import ASGITransport, AsyncClient
+
+from timebeing_backend import token_verifier as token_verifier_module
+from timebeing_backend.auth_middleware import token_verifier
+from timebeing_backend.main import app
+from timebeing_backend.token_verifier import TokenVerifier
+
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest_asyncio.fixture
+async def anonymous_client():
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url='http://test'
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def jwks(monkeypatch):
+    """A JWKS holding only the ``known`` key, as if just fetched."""
+
+    async def refresh():
+        token_verifier._jwks_fetched_at = time.monotonic()
+
+    monkeypatch.setattr(token_verifier, '_static_key', None)
+    monkeypatch.setattr(token_verifier, 'authorized_parties', None)
+    monkeypatch.setattr(
+        token_verifier, '_jwks', {'known': PRIVATE_KEY.public_key()}
+    )
+    monkeypatch.setattr(token_verifier, '_refresh_jwks', refresh)
+    token_verifier.tokens.clear()
+
+
+def _token(claims: dict | None = None, **headers) -> str:
+    return jwt.encode(
+        {'sub': 'user_test', 'exp': int(time.time()) + 60, **(claims or {})},
+        PRIVATE_KEY.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+        algorithm='RS256',
+        headers=headers,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('jwks')
+@pytest.mark.parametrize('headers', [{'kid': 'unknown'}, {}])
+async def test_unknown_signing_key_is_unauthorized(anonymous_client, headers):
+    response = await anonymous_client.get(
+        '/api/v1/habits/',
+        headers={'Authorization': f'Bearer {_token(**headers)}'},
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('jwks')
+async def test_known_signing_key_is_verified():
+    claims = await token_verifier.verify(_token(kid='known'))
+
+    assert claims['sub'] == 'user_test'
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('jwks')
+async def test_only_a_named_party_must_be_authorized(monkeypatch):
+    monkeypatch.setattr(
+        token_verifier, 'authorized_parties', frozenset({'https://app'})
+    )
+
+    assert await token_verifier.verify(_token(kid='known'))
+    assert await token_verifier.verify(
+        _token({'azp': 'https://app'}, kid='known')
+    )
+    with pytest.raises(jwt.InvalidTokenError):
+        await token_verifier.verify(
+            _token({'azp': 'https://other'}, kid='known')
+        )
+
+
+@pytest.mark.asyncio
+async def test_keys_are_fetched_on_a_freshly_booted_host(monkeypatch):
+    verifier = TokenVerifier(jwt_key=None, secret_key='sk_test')
+
+    async def refresh():
+        verifier._jwks = {'known': PRIVATE_KEY.public_key()}
+        verifier._jwks_fetched_at = time.monotonic()
+
+    # A host up for five seconds, well under JWKS_MIN_REFRESH_SECONDS
+    monkeypatch.setattr(
+        token_verifier_module,
+        'time',
+        SimpleNamespace(time=time.time, monotonic=lambda: 5.0),
+    )
+    monkeypatch.setattr(verifier, '_refresh_jwks', refresh)
+
+    claims = await verifier.verify(_token(kid='known'))
+
+    assert claims['sub'] == 'user_test'
@@ -0,0 +1,44 @@
+import tracemalloc
+
+import pytest
+from sqlalchemy import text
+
+from tests.factories import USER_ID
+from timebeing_backend import export
+from timebeing_backend.database import engine
+
+TASKS = 1_000_000
+# A few EXPORT_YIELD_PER batches in flight peak at about 4 MiB; loading
+# every task at once needs well over a gigabyte
+PEAK_BYTES = 32 * 1024 * 1024
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_export_memory_stays_flat(session):
+    await session.execute(
+        text(
+            'INSERT INTO task (id, title, priority, user_id, is_focus, status,'
+            ' due_date, created_at, updated_at) '
+            "SELECT gen_random_uuid(), 'Tarefa ' || n, 'baixa', :user_id,"
+            " false, n % 2 = 0, LOCALTIMESTAMP + n * interval '1 minute',"
+            ' now(), now() '
+            'FROM generate_series(1, :tasks) AS n'
+        ),
+        {'user_id': USER_ID, 'tasks': TASKS},
+    )
+    await session.commit()
+
+    rows = 0
+    tracemalloc.start()
+    try:
+        async for chunk in export.export_tasks(
+            USER_ID, export.ExportFormat.ndjson, engine
+        ):
+            rows += chunk.count(b'\n')
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert rows == TASKS
+    assert peak < PEAK_BYTES
@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import Select
+
+from tests.factories import USER_ID
+from timebeing_backend.database import engine
+from timebeing_backend.models.notification import NotificationJob
+from timebeing_backend.scheduler import outbox
+from timebeing_backend.scheduler.messages import (
+    CONTENT_TYPES,
+    NotificationMessage,
+    encode_notification,
+)
+from timebeing_backend.scheduler.outbox import OutboxWorker
+
+MESSAGE = NotificationMessage(
+    task_id='0b7e1f0a-3c8e-4d55-9a57-1f5f3cbb8c11',
+    user_id=USER_ID,
+    title='Reunião',
+    email='user@example.com',
+    due_at=1_792_515_600,
+    notify_at=timedelta(minutes=30),
+)
+
+
+def test_v1_message_round_trips():
+    body, content_type, headers = encode_notification(
+        MESSAGE.model_dump(mode='json'), 'v1'
+    )
+
+    assert content_type == CONTENT_TYPES['v1']
+    assert headers == {'x-schema-version': 1}
+    assert b'"notify_at":"PT30M"' in body
+    assert NotificationMessage.model_validate_json(body) == MESSAGE
+
+
+def test_legacy_format_keeps_the_old_fields():
+    body, content_type, headers = encode_notification(
+        MESSAGE.model_dump(mode='json'), 'legacy'
+    )
+
+    assert content_type == CONTENT_TYPES['legacy']
+    assert not headers
+    assert body == (
+        b'{"title": "Reuni\\u00e3o", "email": "user@example.com", '
+        b'"notify_at": "0:30:00"}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_due_at_is_the_instant_the_client_sent(
+    db_timezone, client, session, monkeypatch
+):
+    async def email(user_id):
+        return 'user@example.com'
+
+    monkeypatch.setattr(outbox, 'get_user_primary_email', email)
+    due_date = '2026-11-20T12:00:00-03:00'
+
+    response = await client.post(
+        '/api/v1/tasks/',
+        json={'title': 'Reunião', 'due_date': due_date, 'notify_at': 'PT30M'},
+    )
+    assert response.status_code == HTTPStatus.CREATED
+
+    worker = OutboxWorker(batch_size=10, poll_seconds=1, max_attempts=1)
+    assert await worker.drain() == 1
+
+    job = await session.scalar(Select(NotificationJob))
+    message = NotificationMessage.model_validate(job.payload)
+    assert message.due_at == datetime.fromisoformat(due_date).timestamp()
+    assert message.notify_at == timedelta(minutes=30)
+
+
+@pytest.mark.asyncio
+async def test_patch_does_not_wait_for_the_email_lookup(
+    monkeypatch, client, session
+):
+    # A PATCH stuck behind the worker's row locks fails instead of hanging
+    monkeypatch.setenv('PGOPTIONS', '-c lock_timeout=2s')
+    await engine.dispose()
+    looking_up, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_email(user_id):
+        looking_up.set()
+        await release.wait()
+        return 'user@example.com'
+
+    monkeypatch.setattr(outbox, 'get_user_primary_email', slow_email)
+    response = await client.post(
+        '/api/v1/tasks/',
+        json={
+            'title': 'Reunião',
+            'due_date': '2026-11-20T12:00:00-03:00',
+            'notify_at': 'PT30M',
+        },
+    )
+    task_id = response.json()['id']
+
+    worker = OutboxWorker(batch_size=10, poll_seconds=1, max_attempts=1)
+    drain = asyncio.create_task(worker.drain())
+    await looking_up.wait()
+
+    # Replaces the outbox row the worker is resolving an email for
+    response = await client.patch(
+        f'/api/v1/tasks/{task_id}',
+        json={'due_date': '2026-11-21T12:00:00-03:00'},
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    release.set()
+    await drain
+    await worker.drain()
+
+    job = await session.scalar(Select(NotificationJob))
+    message = NotificationMessage.model_validate(job.payload)
+    assert message.due_at == (
+        datetime.fromisoformat('2026-11-21T12:00:00-03:00').timestamp()
+    )
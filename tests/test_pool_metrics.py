@@ -0,0 +1,41 @@
+from contextlib import AsyncExitStack
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from timebeing_backend import pool_metrics
+from timebeing_backend.pool_metrics import InstrumentedAsyncQueuePool
+from timebeing_backend.settings import settings
+
+CHECKOUTS = 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(('max_overflow', 'expected_waits'), [(-1, 0), (1, 1)])
+async def test_waits_respect_the_overflow_limit(
+    monkeypatch, max_overflow, expected_waits
+):
+    waits = []
+    monkeypatch.setattr(
+        pool_metrics.waits, 'add', lambda amount, _: waits.append(amount)
+    )
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=max_overflow,
+        pool_timeout=0.1,
+    )
+
+    try:
+        async with AsyncExitStack() as stack:
+            for _ in range(CHECKOUTS):
+                try:
+                    await stack.enter_async_context(engine.connect())
+                except PoolTimeoutError:
+                    break
+    finally:
+        await engine.dispose()
+
+    assert len(waits) == expected_waits
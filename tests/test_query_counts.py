@@ -0,0 +1,102 @@
+import pytest
+import pytest_asyncio
+
+from tests.factories import make_habit, make_project, make_task
+
+# One round trip per write: server defaults come back through RETURNING
+WRITES = [
+    pytest.param('post', '/tasks/', {'title': 'Tarefa'}, id='create task'),
+    pytest.param(
+        'patch', '/tasks/{task}', {'description': 'Nova'}, id='patch task'
+    ),
+    pytest.param('delete', '/tasks/{task}', None, id='delete task'),
+    pytest.param('post', '/habits/', {'title': 'Ler'}, id='create habit'),
+    pytest.param(
+        'patch', '/habits/{habit}', {'title': 'Correr'}, id='patch habit'
+    ),
+    pytest.param('delete', '/habits/{habit}', None, id='delete habit'),
+    pytest.param('post', '/projects/', {'title': 'Casa'}, id='create project'),
+    pytest.param(
+        'patch', '/projects/{project}', {'title': 'Obra'}, id='patch project'
+    ),
+    pytest.param(
+        'delete', '/projects/{empty_project}', None, id='delete project'
+    ),
+]
+
+# Each project endpoint pinned to its TaskLoading strategy
+PROJECT_READS = [
+    # none: Project.tasks is never touched
+    pytest.param('get', '/projects/', 1, id='list projects'),
+    # counts: aggregates joined onto the page query
+    pytest.param(
+        'get', '/projects/?include_stats=true', 1, id='list project stats'
+    ),
+    # none
+    pytest.param('get', '/projects/{project}', 1, id='get project'),
+    # none: the ownership check, then the tasks themselves
+    pytest.param('get', '/projects/{project}/tasks', 2, id='project tasks'),
+    # none: UPDATE ... RETURNING
+    pytest.param('patch', '/projects/{project}', 1, id='patch project'),
+    # none: the task-less fast path
+    pytest.param(
+        'delete', '/projects/{empty_project}', 1, id='delete empty project'
+    ),
+    # tree: failed fast path, project, tasks, two subtask levels, then the
+    # DELETEs for subtasks, tasks and project whatever the number of tasks
+    pytest.param('delete', '/projects/{project}', 8, id='delete project'),
+]
+
+
+@pytest_asyncio.fixture
+async def statements_of(session, client, queries):
+    """Send a request against seeded rows and return the SQL it ran."""
+    project = make_project()
+    empty_project = make_project(title='Vazio')
+    habit = make_habit()
+    session.add_all([project, empty_project, habit])
+    await session.flush()
+
+    tasks = [make_task(project_id=project.id) for _ in range(3)]
+    session.add_all(tasks)
+    await session.flush()
+
+    session.add(make_task(title='Subtarefa', parent_task_id=tasks[1].id))
+    await session.commit()
+
+    ids = {
+        'project': project.id,
+        'empty_project': empty_project.id,
+        'habit': habit.id,
+        'task': tasks[0].id,
+    }
+
+    async def statements_of(method, path, body=None) -> list[str]:
+        queries.clear()
+        response = await client.request(
+            method,
+            '/api/v1' + path.format(**ids),
+            **({} if body is None else {'json': body}),
+        )
+
+        assert response.is_success, response.text
+        return list(queries)
+
+    return statements_of
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(('method', 'path', 'body'), WRITES)
+async def test_write_query_count(statements_of, method, path, body):
+    statements = await statements_of(method, path, body)
+
+    assert len(statements) == 1, statements
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(('method', 'path', 'expected'), PROJECT_READS)
+async def test_project_query_count(statements_of, method, path, expected):
+    body = {'title': 'Obra'} if method == 'patch' else None
+    statements = await statements_of(method, path, body)
+
+    assert len(statements) == expected, statements
@@ -0,0 +1,56 @@
+import time
+from http import HTTPStatus
+
+import pytest
+from starlette.requests import Request
+
+from timebeing_backend import database
+
+
+def _request(headers: dict[str, str]) -> Request:
+    return Request({
+        'type': 'http',
+        'headers': [
+            (name.lower().encode(), value.encode())
+            for name, value in headers.items()
+        ],
+    })
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    replica = object()
+    monkeypatch.setattr(database, 'replica_engine', replica)
+    return replica
+
+
+@pytest.mark.asyncio
+async def test_write_hands_the_client_a_marker(client):
+    response = await client.post('/api/v1/projects/', json={'title': 'Casa'})
+
+    assert response.status_code == HTTPStatus.CREATED
+    marker = response.headers[database.READ_YOUR_WRITES_HEADER]
+    assert response.cookies[database.READ_YOUR_WRITES_COOKIE] == marker
+    assert abs(time.time() - float(marker)) < 1
+
+    response = await client.get('/api/v1/projects/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert database.READ_YOUR_WRITES_HEADER not in response.headers
+
+
+def test_marked_reads_stay_on_the_primary(replica):
+    now = f'{time.time():.3f}'
+    stale = f'{time.time() - 60:.3f}'
+
+    assert database.read_bind(_request({})) is replica
+    assert database.read_bind(_request({'X-Last-Write': stale})) is replica
+    assert database.read_bind(_request({'X-Last-Write': 'nan'})) is replica
+    assert database.read_bind(_request({'Cookie': 'last_write=x'})) is replica
+    assert (
+        database.read_bind(_request({'X-Last-Write': now})) is database.engine
+    )
+    assert (
+        database.read_bind(_request({'Cookie': f'last_write={now}'}))
+        is database.engine
+    )
@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Select
+
+from tests.factories import make_task
+from timebeing_backend.models.notification import NotificationOutbox
+from timebeing_backend.scheduler.reconcile import reconcile
+
+
+def pending_task(**values):
+    values.setdefault('due_date', datetime.now() + timedelta(days=1))
+    values.setdefault('notify_at', timedelta(minutes=30))
+    return make_task(**values)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_requeues_every_pending_task(session):
+    tasks = [pending_task(title='A'), pending_task(title='B')]
+    session.add_all([*tasks, make_task(title='Sem lembrete')])
+    await session.commit()
+
+    report = await reconcile()
+
+    rows = (await session.scalars(Select(NotificationOutbox))).all()
+    assert report['requeued'] == len(tasks)
+    assert {row.task_id for row in rows} == {task.id for task in tasks}
+    assert len({row.id for row in rows}) == len(tasks)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_skips_tasks_already_queued(session):
+    session.add(pending_task())
+    await session.commit()
+
+    await reconcile()
+    report = await reconcile()
+
+    assert report['requeued'] == 0
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+import pytest_asyncio
+
+from tests.factories import make_habit, make_project, make_task
+from timebeing_backend.models.task import TaskPriorityState
+from timebeing_backend.settings import settings
+
+
+@pytest_asyncio.fixture
+async def paths(session):
+    project = make_project(title='Mudança', description='Caixas e fretes')
+    session.add_all([
+        project,
+        make_habit(title='Meditação', current_score=7),
+        make_habit(title='Leitura'),
+    ])
+    await session.flush()
+
+    parent = make_task(
+        title='Reunião às 9h',
+        description='Pauta: “orçamento”',
+        due_date=datetime(2026, 3, 1, 9, 30, 15, 123456),
+        notify_at=timedelta(hours=1, minutes=30),
+        scheduled_start_time=datetime(2026, 3, 1, 9),
+        scheduled_end_time=datetime(2026, 3, 1, 10),
+        priority=TaskPriorityState.alta,
+        duration_estimate_blocks=2,
+        location_text='São Paulo',
+        location_lat=Decimal('-23.5505200'),
+        location_lon=Decimal('-46.6333090'),
+        project_id=project.id,
+    )
+    session.add_all([parent, make_task(project_id=project.id, status=True)])
+    await session.flush()
+
+    session.add(make_task(title='Ata', parent_task_id=parent.id))
+    await session.commit()
+
+    return [
+        '/api/v1/tasks/?limit=2',
+        '/api/v1/tasks/?sort=due_date&limit=10',
+        f'/api/v1/tasks/{parent.id}/subtasks',
+        '/api/v1/habits/?limit=1',
+        '/api/v1/projects/',
+        '/api/v1/projects/?include_stats=true',
+        f'/api/v1/projects/{project.id}/tasks',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fast_json_matches_the_default_encoder(
+    client, paths, monkeypatch
+):
+    for path in paths:
+        monkeypatch.setattr(settings, 'FAST_JSON_RESPONSES', False)
+        default = await client.get(path)
+        monkeypatch.setattr(settings, 'FAST_JSON_RESPONSES', True)
+        fast = await client.get(path)
+
+        assert default.status_code == fast.status_code == HTTPStatus.OK, path
+        assert fast.content == default.content, path
+        assert fast.headers['content-type'] == default.headers['content-type']
@@ -0,0 +1,57 @@
+import time
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import Select, func
+
+from timebeing_backend.models.notification import NotificationJob
+from timebeing_backend.scheduler import manager
+from timebeing_backend.scheduler.manager import NotificationScheduler
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    payloads = []
+
+    async def send(payload):
+        payloads.append(payload)
+
+    monkeypatch.setattr(manager, 'send_notification_job', send)
+    return payloads
+
+
+@pytest.fixture
+def app_timezone(monkeypatch):
+    """Run the test with the process clock three hours behind UTC."""
+    monkeypatch.setenv('TZ', 'America/Sao_Paulo')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('app_timezone')
+async def test_due_jobs_follow_the_database_clock(session, sent):
+    now = await session.scalar(Select(func.localtimestamp()))
+    session.add_all([
+        NotificationJob(
+            next_run_time=now - timedelta(minutes=1),
+            payload={'job': 'due'},
+            task_id=None,
+        ),
+        NotificationJob(
+            next_run_time=now + timedelta(hours=1),
+            payload={'job': 'later'},
+            task_id=None,
+        ),
+    ])
+    await session.commit()
+
+    scheduler = NotificationScheduler(batch_size=10, max_sleep_seconds=7200)
+
+    assert await scheduler.run_due_jobs() == 1
+    assert sent == [{'job': 'due'}]
+
+    delay = await scheduler._seconds_until_next_job()
+    assert delay == pytest.approx(timedelta(hours=1).total_seconds(), abs=60)
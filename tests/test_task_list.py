@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+
+from tests.factories import make_task
+
+PAGE_SIZE = 4
+
+
+async def _all_pages(client, **params) -> list[str]:
+    ids, cursor = [], None
+
+    while True:
+        response = await client.get(
+            '/api/v1/tasks/',
+            params={**params, 'limit': PAGE_SIZE}
+            | ({'cursor': cursor} if cursor else {}),
+        )
+        assert response.status_code == HTTPStatus.OK
+
+        page = response.json()
+        assert len(page['tasks']) <= PAGE_SIZE
+        ids += [task['id'] for task in page['tasks']]
+
+        cursor = page['next_cursor']
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+async def test_nullable_sort_pages_values_then_nulls(client, session, order):
+    start = datetime(2026, 11, 20, 9)
+    tasks = [
+        # Repeated due dates make the id the tie-breaker
+        make_task(
+            title=f'Task {index}',
+            due_date=None
+            if index % 3 == 0
+            else start + timedelta(days=index % 4),
+        )
+        for index in range(17)
+    ]
+    session.add_all(tasks)
+    await session.commit()
+
+    descending = order == 'desc'
+    dated = sorted(
+        (task for task in tasks if task.due_date),
+        key=lambda task: (task.due_date, task.id),
+        reverse=descending,
+    )
+    undated = sorted(
+        (task for task in tasks if not task.due_date),
+        key=lambda task: task.id,
+        reverse=descending,
+    )
+
+    ids = await _all_pages(client, sort='due_date', order=order)
+
+    assert ids == [str(task.id) for task in dated + undated]
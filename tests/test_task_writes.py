@@ -0,0 +1,55 @@
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import Select, func
+
+from tests.factories import make_project, make_task
+from timebeing_backend.cruds.task import TASK_TREE_DEPTH_LIMIT
+from timebeing_backend.models.task import Task
+
+OTHER_USER_ID = 'user_other'
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_removes_subtrees_past_the_depth_limit(
+    client, session
+):
+    root = make_task(title='Raiz')
+    session.add(root)
+    await session.flush()
+
+    parent = root
+    for depth in range(TASK_TREE_DEPTH_LIMIT + 2):
+        parent = make_task(title=f'Nível {depth}', parent_task_id=parent.id)
+        session.add(parent)
+        await session.flush()
+    await session.commit()
+
+    response = await client.request(
+        'DELETE', '/api/v1/tasks/bulk', json={'ids': [str(root.id)]}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['results'][0]['status_code'] == HTTPStatus.OK
+    assert await session.scalar(Select(func.count()).select_from(Task)) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('field', ['parent_task_id', 'project_id'])
+async def test_single_writes_check_reference_ownership(client, session, field):
+    parent = make_task(user_id=OTHER_USER_ID)
+    project = make_project(user_id=OTHER_USER_ID)
+    own = make_task(title='Minha')
+    session.add_all([parent, project, own])
+    await session.commit()
+
+    other = {'parent_task_id': parent.id, 'project_id': project.id}[field]
+    body = {'title': 'Tarefa', field: str(other)}
+
+    created = await client.post('/api/v1/tasks/', json=body)
+    patched = await client.patch(f'/api/v1/tasks/{own.id}', json=body)
+
+    assert created.status_code == HTTPStatus.NOT_FOUND
+    assert patched.status_code == HTTPStatus.NOT_FOUND
+    await session.refresh(own)
+    assert getattr(own, field) is None
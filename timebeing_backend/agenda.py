@@ -0,0 +1,44 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+Interval = tuple[datetime, datetime]
+
+
+def merge_busy(
+    intervals: Iterable[Interval], start: datetime, end: datetime
+) -> list[Interval]:
+    """
+    Merge ``intervals`` sorted by start into disjoint busy blocks clipped
+    to ``[start, end)``, in a single pass.
+    """
+    busy: list[list[datetime]] = []
+
+    for interval_start, interval_end in intervals:
+        lower, upper = max(interval_start, start), min(interval_end, end)
+        if lower >= upper:
+            continue
+
+        if busy and lower <= busy[-1][1]:
+            busy[-1][1] = max(busy[-1][1], upper)
+        else:
+            busy.append([lower, upper])
+
+    return [(lower, upper) for lower, upper in busy]
+
+
+def free_between(
+    busy: list[Interval], start: datetime, end: datetime
+) -> list[Interval]:
+    """The gaps of ``[start, end)`` not covered by the merged ``busy``."""
+    free = []
+    cursor = start
+
+    for lower, upper in busy:
+        if lower > cursor:
+            free.append((cursor, lower))
+        cursor = max(cursor, upper)
+
+    if cursor < end:
+        free.append((cursor, end))
+
+    return free
@@ -2,10 +2,13 @@ import logging
 import os
 from typing import Annotated
 
-from clerk_backend_api import AuthenticateRequestOptions, Clerk
+import jwt
+from clerk_backend_api import Clerk
 from fastapi import Depends, HTTPException, Request
 
+from .cache import AsyncTTLCache
 from .settings import settings
+from .token_verifier import TokenVerifier
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -19,16 +22,25 @@ if not clerk_secret:
     raise ValueError('CLERK_SECRET_KEY é obrigatória')
 
 if not jwt_key:
-    logger.error('JWT_KEY não configurada')
-    raise ValueError('JWT_KEY é obrigatória')
+    logger.warning('JWT_KEY não configurada, usando JWKS do Clerk')
 
 clerk_sdk = Clerk(bearer_auth=clerk_secret)
 
+token_verifier = TokenVerifier(jwt_key=jwt_key, secret_key=clerk_secret)
+
+user_email_cache = AsyncTTLCache(
+    max_size=settings.USER_EMAIL_CACHE_MAX_SIZE,
+    ttl=settings.USER_EMAIL_CACHE_TTL_SECONDS,
+)
+
 
 async def get_user_primary_email(user_id: str) -> str:
     """
     Get the primary email address for a user from Clerk.
 
+    Lookups are served from ``user_email_cache``; concurrent misses for the
+    same user share a single Clerk request.
+
     Args:
         user_id (str): The Clerk user ID
 
@@ -38,8 +50,14 @@ async def get_user_primary_email(user_id: str) -> str:
     Raises:
         HTTPException: If user not found or has no email addresses
     """
+    return await user_email_cache.get_or_load(
+        user_id, lambda: _fetch_user_primary_email(user_id)
+    )
+
+
+async def _fetch_user_primary_email(user_id: str) -> str:
     try:
-        user = clerk_sdk.users.get(user_id=user_id)
+        user = await clerk_sdk.users.get_async(user_id=user_id)
 
         if not user.email_addresses:
             logger.error('User %s has no email addresses', user_id)
@@ -111,29 +129,22 @@ async def get_current_user_id(request: Request) -> str:
                 status_code=401, detail='Invalid authorization header format'
             )
 
-        # Authenticate the request using Clerk
-        request_state = clerk_sdk.authenticate_request(
-            request,
-            AuthenticateRequestOptions(
-                authorized_parties=[
-                    'http://localhost:3000',
-                    'http://127.0.0.1:3000',
-                    'http://177.154.180.9:3000',
-                ],
-                jwt_key=jwt_key,
-            ),
-        )
-
-        # Check if user is signed in
-        if not request_state.is_signed_in:
-            logger.warning('User not signed in according to Clerk')
+        # Verify the session token locally (cached until it expires)
+        try:
+            payload = await token_verifier.verify(
+                auth_header.removeprefix('Bearer ').strip()
+            )
+        except jwt.PyJWTError as e:
+            # Also InvalidKeyError for an unknown ``kid``, which is not an
+            # InvalidTokenError
+            logger.warning('Invalid session token: %s', str(e))
             raise HTTPException(
                 status_code=401,
                 detail='Authentication required - user not signed in',
-            )
+            ) from e
 
         # Extract user ID from the token payload
-        user_id = request_state.payload.get('sub')
+        user_id = payload.get('sub')
         if not user_id:
             logger.error('Token payload missing user ID (sub)')
             raise HTTPException(
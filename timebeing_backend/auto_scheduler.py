@@ -0,0 +1,129 @@
+"""
+Place a user's unscheduled tasks into the free time of a window.
+
+Tasks are taken earliest deadline first, then by priority, focus and age,
+from a heap, and each one goes into the earliest free slot long enough
+to hold it. Free slots live in a max segment tree over their remaining
+lengths, so finding the leftmost slot that fits and shrinking it are both
+O(log m), and the whole proposal is O((n + m) log m) for ``n`` tasks and
+``m`` free slots.
+"""
+
+import heapq
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from .models.task import TaskPriorityState
+
+Interval = tuple[datetime, datetime]
+
+PRIORITY_RANK = {
+    TaskPriorityState.alta: 0,
+    TaskPriorityState.media: 1,
+    TaskPriorityState.baixa: 2,
+}
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """The fields of an open task that scheduling looks at."""
+
+    id: uuid.UUID
+    priority: TaskPriorityState
+    created_at: datetime
+    due_date: datetime | None = None
+    duration_estimate_blocks: int | None = None
+    is_focus: bool = False
+
+
+class FreeSlots:
+    """Free intervals indexed by a max segment tree of remaining seconds."""
+
+    def __init__(self, free: list[Interval]):
+        self.starts = [start for start, _ in free]
+        self.size = 1
+        while self.size < len(free):
+            self.size *= 2
+
+        self.tree = [0] * (2 * self.size)
+        for index, (start, end) in enumerate(free):
+            self.tree[self.size + index] = (end - start).total_seconds()
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def first_fit(self, seconds: float) -> int | None:
+        """Index of the leftmost slot with at least ``seconds`` left."""
+        if self.tree[1] < seconds:
+            return None
+
+        node = 1
+        while node < self.size:
+            node *= 2
+            if self.tree[node] < seconds:
+                node += 1
+
+        return node - self.size
+
+    def take(self, index: int, duration: timedelta) -> datetime:
+        """Claim ``duration`` from the start of a slot; returns its start."""
+        start = self.starts[index]
+        self.starts[index] = start + duration
+
+        node = self.size + index
+        self.tree[node] -= duration.total_seconds()
+        node //= 2
+        while node:
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+        return start
+
+
+def _order(task: Candidate, index: int) -> tuple:
+    # Tasks without a deadline go after every task that has one
+    return (
+        task.due_date is None,
+        task.due_date or datetime.max,
+        PRIORITY_RANK[task.priority],
+        not task.is_focus,
+        task.created_at,
+        index,
+    )
+
+
+def propose_schedule(
+    tasks: Iterable[Candidate], free: list[Interval], block: timedelta
+) -> tuple[list[tuple[uuid.UUID, datetime, datetime]], list[uuid.UUID]]:
+    """
+    Return ``(placements, unscheduled)`` for ``tasks`` over the disjoint,
+    start-ordered ``free`` intervals.
+
+    A task lasts ``duration_estimate_blocks`` blocks (one when it has no
+    estimate) and is only placed if it ends by its ``due_date``.
+    """
+    tasks = list(tasks)
+    heap = [(_order(task, index), task) for index, task in enumerate(tasks)]
+    heapq.heapify(heap)
+
+    slots = FreeSlots(free)
+    placements, unscheduled = [], []
+
+    while heap:
+        _, task = heapq.heappop(heap)
+        duration = block * max(task.duration_estimate_blocks or 1, 1)
+
+        index = slots.first_fit(duration.total_seconds())
+        if index is None or (
+            task.due_date is not None
+            and slots.starts[index] + duration > task.due_date
+        ):
+            unscheduled.append(task.id)
+            continue
+
+        start = slots.take(index, duration)
+        placements.append((task.id, start, start + duration))
+
+    placements.sort(key=lambda placement: placement[1])
+    return placements, unscheduled
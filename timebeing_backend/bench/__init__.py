@@ -0,0 +1,8 @@
+"""
+Benchmarks for the API.
+
+``python -m timebeing_backend.bench`` runs the CPU-bound cases. The other
+modules of this package measure the paths that need a database or a
+broker and are run one by one, e.g.
+``python -m timebeing_backend.bench.indexes``.
+"""
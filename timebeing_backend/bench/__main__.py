@@ -0,0 +1,235 @@
+"""
+Benchmarks for the CPU-bound parts of the API.
+
+Each case builds a synthetic workload, keeps the best of a few runs and
+fails when it goes over its budget. Run them with ``task bench``.
+"""
+
+import asyncio
+import logging
+import random
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import NamedTuple
+from unittest import mock
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from starlette.requests import Request
+
+from .. import auth_middleware
+from ..agenda import free_between, merge_busy
+from ..auto_scheduler import Candidate, propose_schedule
+from ..main import app
+from ..models.task import Task, TaskPriorityState
+from ..responses import TASK_LIST, list_response
+from ..routers.task import list_tasks
+from ..settings import settings
+from ..token_verifier import TokenVerifier
+
+ROUNDS = 5
+# Share of synthetic tasks that have a deadline / are focus tasks
+DUE_RATIO = 0.7
+FOCUS_RATIO = 0.1
+
+
+class Case(NamedTuple):
+    run: Callable[[], object]
+    # Seconds the best round may take
+    budget: float
+    # Units of work per round, reported as a rate
+    operations: int
+    unit: str
+
+
+def _schedule_workload(
+    task_count: int, busy_count: int
+) -> Callable[[], object]:
+    rng = random.Random(task_count)
+    start = datetime(2026, 1, 5, 8)
+    end = start + timedelta(days=90)
+    minutes = int((end - start).total_seconds() // 60)
+
+    busy = []
+    for _ in range(busy_count):
+        offset = timedelta(minutes=rng.randrange(minutes))
+        busy.append((
+            start + offset,
+            start + offset + timedelta(minutes=rng.choice((30, 60, 120))),
+        ))
+    busy.sort()
+
+    tasks = [
+        Candidate(
+            id=uuid.uuid4(),
+            priority=rng.choice(list(TaskPriorityState)),
+            created_at=start - timedelta(minutes=index),
+            due_date=(
+                start + timedelta(minutes=rng.randrange(minutes))
+                if rng.random() < DUE_RATIO
+                else None
+            ),
+            duration_estimate_blocks=rng.choice((None, 1, 2, 3, 4)),
+            is_focus=rng.random() < FOCUS_RATIO,
+        )
+        for index in range(task_count)
+    ]
+
+    def run():
+        merged = merge_busy(busy, start, end)
+        free = free_between(merged, start, end)
+        return propose_schedule(tasks, free, timedelta(minutes=30))
+
+    return run
+
+
+def _auth_workload(requests: int, cached: bool) -> Callable[[], object]:
+    """``requests`` calls of the auth dependency with one bearer token."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    verifier = TokenVerifier(
+        jwt_key=key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode(),
+        secret_key=None,
+    )
+    verifier.authorized_parties = None
+
+    token = jwt.encode(
+        {'sub': 'user_bench', 'exp': int(time.time()) + 3600},
+        key,
+        algorithm='RS256',
+    )
+    scope = {
+        'type': 'http',
+        'headers': [(b'authorization', f'Bearer {token}'.encode())],
+    }
+
+    async def authenticate():
+        for _ in range(requests):
+            if not cached:
+                verifier.tokens.clear()
+            await auth_middleware.get_current_user_id(Request(scope))
+
+    def run():
+        with mock.patch.object(auth_middleware, 'token_verifier', verifier):
+            asyncio.run(authenticate())
+
+    return run
+
+
+def _response_workload(task_count: int, fast: bool) -> Callable[[], object]:
+    """One ``GET /tasks/`` page of ``task_count`` ORM rows, to JSON bytes."""
+    rng = random.Random(task_count)
+    start = datetime(2026, 1, 5, 8)
+
+    tasks = []
+    for index in range(task_count):
+        scheduled = start + timedelta(hours=rng.randrange(2_000))
+        task = Task(
+            title=f'Tarefa {index}',
+            description='Pauta: “orçamento”' if index % 2 else None,
+            due_date=(
+                scheduled + timedelta(days=1)
+                if rng.random() < DUE_RATIO
+                else None
+            ),
+            notify_at=timedelta(minutes=30),
+            scheduled_start_time=scheduled,
+            scheduled_end_time=scheduled + timedelta(hours=1),
+            priority=rng.choice(list(TaskPriorityState)),
+            duration_estimate_blocks=rng.choice((None, 1, 2, 3, 4)),
+            location_text='São Paulo',
+            location_lat=Decimal('-23.5505200'),
+            location_lon=Decimal('-46.6333090'),
+            ai_context_text=None,
+            parent_task_id=None,
+            project_id=None,
+            user_id='user_bench',
+        )
+        task.id = uuid.UUID(int=rng.getrandbits(128), version=4)
+        task.created_at = task.updated_at = start
+        tasks.append(task)
+
+    content = {'tasks': tasks, 'next_cursor': None}
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.endpoint is list_tasks
+    )
+
+    async def default_response():
+        # What FastAPI does with the plain dict the endpoint returns
+        body = await serialize_response(
+            field=route.secure_cloned_response_field,
+            response_content=content,
+        )
+        return JSONResponse(body).body
+
+    def run():
+        if not fast:
+            return asyncio.run(default_response())
+
+        with mock.patch.object(settings, 'FAST_JSON_RESPONSES', True):
+            return list_response(TASK_LIST, content).body
+
+    return run
+
+
+CASES = {
+    'auto_scheduler 10k tasks / 2k blocks': Case(
+        _schedule_workload(10_000, 2_000), 0.5, 10_000, 'tasks'
+    ),
+    'auto_scheduler 1k tasks / 200 blocks': Case(
+        _schedule_workload(1_000, 200), 0.05, 1_000, 'tasks'
+    ),
+    'auth dependency, token cache': Case(
+        _auth_workload(10_000, cached=True), 0.5, 10_000, 'requests'
+    ),
+    'auth dependency, no token cache': Case(
+        _auth_workload(1_000, cached=False), 1.0, 1_000, 'requests'
+    ),
+    'task list response, default encoder': Case(
+        _response_workload(1_000, fast=False), 0.15, 1_000, 'tasks'
+    ),
+    'task list response, FAST_JSON_RESPONSES': Case(
+        _response_workload(1_000, fast=True), 0.05, 1_000, 'tasks'
+    ),
+}
+
+
+def main() -> int:
+    failed = 0
+    # Per-request log lines would swamp both the output and the timings
+    logging.disable(logging.INFO)
+
+    for name, case in CASES.items():
+        best = float('inf')
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            case.run()
+            best = min(best, time.perf_counter() - started)
+
+        status = 'ok' if best <= case.budget else 'SLOW'
+        failed += best > case.budget
+        print(
+            f'{status:4} {name}: {best * 1000:.1f} ms '
+            f'(budget {case.budget * 1000:.0f} ms), '
+            f'{case.operations / best:,.0f} {case.unit}/s, '
+            f'{best / case.operations * 1e6:.1f} µs each'
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+EXPLAIN ANALYZE of the user-scoped list queries, without and with the
+secondary indexes of ``task``, ``project`` and ``habit``.
+
+Seeds ``--tasks`` tasks, about ``TASKS_PER_USER`` per user with projects,
+subtasks and habits, into a scratch ``bench`` schema of ``DATABASE_URL``.
+Each query is timed on the bare tables, then again once the indexes are
+built. The seed is deterministic, so runs are comparable; the schema is
+dropped at the end. Run with ``task bench_indexes --tasks 2000000``.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from ..cruds.loading import TaskLoading, project_statement
+from ..cruds.task import TASK_SORT_KEYS
+from ..database import Base
+from ..models.habit import Habit
+from ..models.project import Project
+from ..models.task import Task
+from ..pagination import DEFAULT_PAGE_SIZE, paginate, paginate_sorted
+from ..schemas.task import TaskSort
+from ..settings import settings
+
+SCHEMA = 'bench'
+ROUNDS = 5
+TASKS_PER_USER = 2_000
+PROJECTS_PER_USER = 10
+HABITS_PER_USER = 20
+TABLES = [Project.__table__, Habit.__table__, Task.__table__]
+
+# Row n belongs to user n % :users and is that user's k-th row; ids are
+# md5 hashes of n so that parents and projects can be referenced within
+# the same INSERT
+SEED = [
+    """
+    INSERT INTO project (id, title, status, priority, user_id, created_at,
+                         updated_at)
+    SELECT md5('project' || n)::uuid, 'Projeto ' || n, 'criado', 'baixa',
+           'bench_user_' || n % :users,
+           now() - n * interval '1 second', now()
+    FROM generate_series(0, :users * :projects - 1) AS n
+    """,
+    """
+    INSERT INTO habit (id, title, user_id, created_at, updated_at)
+    SELECT md5('habit' || n)::uuid, 'Hábito ' || n,
+           'bench_user_' || n % :users,
+           now() - n * interval '1 second', now()
+    FROM generate_series(0, :users * :habits - 1) AS n
+    """,
+    """
+    INSERT INTO task (id, title, priority, user_id, is_focus, status,
+                      due_date, project_id, parent_task_id, created_at,
+                      updated_at)
+    SELECT md5('task' || n)::uuid, 'Tarefa ' || n, 'baixa',
+           'bench_user_' || n % :users, k % 10 = 0, k % 3 = 0,
+           CASE WHEN k % 4 > 0
+                THEN LOCALTIMESTAMP + k % 5000 * interval '1 hour' END,
+           CASE WHEN k % 2 = 0
+                THEN md5('project' || n % :users
+                         + :users * (k % :projects))::uuid END,
+           CASE WHEN k % 5 = 1 THEN md5('task' || n - :users)::uuid END,
+           now() - n * interval '1 second', now()
+    FROM generate_series(0, :tasks - 1) AS n,
+         LATERAL (SELECT n / :users AS k) AS per_user
+    """,
+]
+
+
+def _queries(user_id: str, project_id, parent_id) -> dict[str, Select]:
+    """The statements behind the list endpoints, for one user."""
+    tasks = Select(Task).where(Task.user_id == user_id)
+    due_date = TASK_SORT_KEYS[TaskSort.due_date]
+
+    return {
+        'tasks page': paginate(tasks, Task, None, DEFAULT_PAGE_SIZE),
+        'tasks by due date': paginate_sorted(
+            tasks, due_date, None, DEFAULT_PAGE_SIZE
+        ),
+        'open tasks by due date': paginate_sorted(
+            tasks.where(Task.status.is_(False)),
+            due_date,
+            None,
+            DEFAULT_PAGE_SIZE,
+            descending=True,
+        ),
+        'project tasks': tasks.where(Task.project_id == project_id),
+        'subtasks': tasks.where(Task.parent_task_id == parent_id),
+        'projects page': paginate(
+            project_statement(user_id), Project, None, DEFAULT_PAGE_SIZE
+        ),
+        'projects with stats': paginate(
+            project_statement(user_id, TaskLoading.counts),
+            Project,
+            None,
+            DEFAULT_PAGE_SIZE,
+        ),
+        'habits page': paginate(
+            Select(Habit).where(Habit.user_id == user_id),
+            Habit,
+            None,
+            DEFAULT_PAGE_SIZE,
+        ),
+    }
+
+
+def _scans(plan: dict) -> list[str]:
+    """The table and index scans of an EXPLAIN plan, e.g. ``Seq Scan task``."""
+    scans = []
+    target = plan.get('Index Name', plan.get('Relation Name'))
+    if target:
+        scans.append(f'{plan["Node Type"]} {target}')
+    for child in plan.get('Plans', []):
+        scans.extend(_scans(child))
+    return scans
+
+
+async def _explain(conn: AsyncConnection, stmt: Select) -> tuple:
+    """Best execution time in ms over ``ROUNDS`` runs, and its scans."""
+    sql = str(
+        stmt.compile(
+            dialect=conn.dialect, compile_kwargs={'literal_binds': True}
+        )
+    )
+
+    best, scans = float('inf'), []
+    for _ in range(ROUNDS):
+        result = await conn.exec_driver_sql(
+            f'EXPLAIN (ANALYZE, FORMAT JSON) {sql}'
+        )
+        (explain,) = result.scalar_one()
+        if explain['Execution Time'] < best:
+            best, scans = explain['Execution Time'], _scans(explain['Plan'])
+
+    return best, scans
+
+
+async def _measure(conn: AsyncConnection, queries: dict) -> dict:
+    await conn.execute(text('ANALYZE project, habit, task'))
+    return {name: await _explain(conn, stmt) for name, stmt in queries.items()}
+
+
+async def run(tasks: int) -> None:
+    users = max(tasks // TASKS_PER_USER, 1)
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        connect_args={'options': f'-c search_path={SCHEMA},public'},
+    )
+    indexes = [index for table in TABLES for index in table.indexes]
+
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+            await conn.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+            await conn.execute(
+                text('CREATE EXTENSION IF NOT EXISTS btree_gist')
+            )
+            await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+            await conn.run_sync(
+                lambda sync: [index.drop(sync) for index in indexes]
+            )
+
+            print(f'Seeding {tasks:,} tasks for {users:,} users...')
+            for statement in SEED:
+                await conn.execute(
+                    text(statement),
+                    {
+                        'tasks': tasks,
+                        'users': users,
+                        'projects': PROJECTS_PER_USER,
+                        'habits': HABITS_PER_USER,
+                    },
+                )
+
+        async with engine.connect() as conn:
+            user_id = 'bench_user_1'
+            project_id = await conn.scalar(
+                Select(Task.project_id)
+                .where(Task.user_id == user_id, Task.project_id.is_not(None))
+                .limit(1)
+            )
+            parent_id = await conn.scalar(
+                Select(Task.parent_task_id)
+                .where(
+                    Task.user_id == user_id, Task.parent_task_id.is_not(None)
+                )
+                .limit(1)
+            )
+            queries = _queries(user_id, project_id, parent_id)
+
+            before = await _measure(conn, queries)
+            await conn.run_sync(
+                lambda sync: [index.create(sync) for index in indexes]
+            )
+            await conn.commit()
+            after = await _measure(conn, queries)
+
+        print(f'{"query":24} {"before":>11} {"after":>10}  plan after')
+        for name in queries:
+            (slow, _), (fast, scans) = before[name], after[name]
+            print(
+                f'{name:24} {slow:8.2f} ms {fast:7.2f} ms  '
+                f'{", ".join(dict.fromkeys(scans))}'
+            )
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        await engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--tasks', type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.tasks))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
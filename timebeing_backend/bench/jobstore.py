@@ -0,0 +1,196 @@
+"""
+add_job and wakeup throughput of the ``notification_job`` table against
+APScheduler's ``SQLAlchemyJobStore``, which it replaced.
+
+Both stores run in a scratch ``bench`` schema of ``DATABASE_URL`` that is
+dropped at the end. Firing a job only counts it, so the numbers are the
+store's: adding ``--jobs`` jobs, then waking up with all of them due and
+running them until none is left. APScheduler is no longer a dependency;
+its cases are skipped unless ``apscheduler<4`` is installed. Run with
+``task bench_jobstore``.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest import mock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import Base, engine
+from ..models.notification import NotificationJob
+from ..models.project import Project
+from ..models.task import Task
+from ..scheduler import jobs as notification_jobs
+from ..scheduler import manager
+from ..scheduler.jobs import add_notification_jobs, send_notification_job
+from ..settings import settings
+
+try:
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+except ImportError:  # pragma: no cover - optional, see the module docstring
+    SQLAlchemyJobStore = None
+
+SCHEMA = 'bench'
+TABLES = [Project.__table__, Task.__table__, NotificationJob.__table__]
+# Always in the past, whatever the database's time zone
+DUE = datetime(2000, 1, 1)
+OUTBOX_BATCH = settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+# What the old scheduler stored; it is resolved on each wakeup, so the
+# patched counter below is what runs
+SEND_REF = f'{send_notification_job.__module__}:send_notification_job'
+
+fired = 0
+
+
+async def _fire(*_):
+    global fired  # noqa: PLW0603
+    fired += 1
+
+
+def _payload(index: int) -> dict:
+    return {'title': f'Tarefa {index}', 'email': 'bench@example.com'}
+
+
+def _report(name: str, jobs: int, elapsed: float):
+    print(f'{name:44} {elapsed * 1000:9.1f} ms {jobs / elapsed:10,.0f} jobs/s')
+
+
+async def _timed(name: str, jobs: int, work):
+    started = time.perf_counter()
+    await work()
+    _report(name, jobs, time.perf_counter() - started)
+
+
+async def _bench_job_table(jobs: int):
+    global fired  # noqa: PLW0603
+    rows = [
+        {'task_id': None, 'next_run_time': DUE, 'payload': _payload(index)}
+        for index in range(jobs)
+    ]
+
+    async def add_one_by_one():
+        for row in rows:
+            async with AsyncSession(engine) as session:
+                await add_notification_jobs(session, [row])
+                await session.commit()
+
+    async def add_in_batches():
+        for start in range(0, jobs, OUTBOX_BATCH):
+            async with AsyncSession(engine) as session:
+                await add_notification_jobs(
+                    session, rows[start : start + OUTBOX_BATCH]
+                )
+                await session.commit()
+
+    scheduler = manager.NotificationScheduler(
+        batch_size=settings.SCHEDULER_BATCH_SIZE,
+        max_sleep_seconds=settings.SCHEDULER_MAX_SLEEP_SECONDS,
+    )
+
+    async def fire_all():
+        while await scheduler.run_due_jobs():
+            pass
+
+    await _timed('job table: add, one per transaction', jobs, add_one_by_one)
+    fired = 0
+    await _timed('job table: wakeup and fire', jobs, fire_all)
+    assert fired == jobs, fired
+
+    await _timed(
+        f'job table: add, batches of {OUTBOX_BATCH}', jobs, add_in_batches
+    )
+    fired = 0
+    await _timed('job table: wakeup and fire', jobs, fire_all)
+    assert fired == jobs, fired
+
+
+async def _bench_apscheduler(jobs: int):
+    global fired  # noqa: PLW0603
+    sync_engine = create_engine(settings.DATABASE_URL)
+    scheduler = AsyncIOScheduler(
+        jobstores={'default': SQLAlchemyJobStore(engine=sync_engine)},
+        # Jobs added while paused must still run once resumed
+        job_defaults={'misfire_grace_time': None},
+    )
+    scheduler.start(paused=True)
+
+    async def add_jobs():
+        for index in range(jobs):
+            scheduler.add_job(
+                SEND_REF,
+                trigger='date',
+                run_date=datetime.now(timezone.utc),
+                args=[_payload(index)],
+                id=str(uuid.uuid4()),
+            )
+
+    async def fire_all():
+        scheduler.resume()
+        while fired < jobs:
+            await asyncio.sleep(0.001)
+        # The last jobs are removed from the store right after they run
+        while scheduler.get_jobs():
+            await asyncio.sleep(0.001)
+
+    try:
+        await _timed('SQLAlchemyJobStore: add_job', jobs, add_jobs)
+        fired = 0
+        await _timed('SQLAlchemyJobStore: wakeup and fire', jobs, fire_all)
+    finally:
+        scheduler.shutdown(wait=False)
+        sync_engine.dispose()
+
+
+async def run(jobs: int):
+    async with engine.begin() as conn:
+        await conn.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        await conn.execute(text(f'CREATE SCHEMA {SCHEMA}'))
+        await conn.execute(text('CREATE EXTENSION IF NOT EXISTS btree_gist'))
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+
+    try:
+        with (
+            mock.patch.object(manager, 'send_notification_job', _fire),
+            mock.patch.object(
+                notification_jobs, 'send_notification_job', _fire
+            ),
+        ):
+            await _bench_job_table(jobs)
+
+            if SQLAlchemyJobStore is None:
+                print(
+                    'SQLAlchemyJobStore: skipped, apscheduler is not '
+                    'installed (pip install "apscheduler<4")'
+                )
+            else:
+                await _bench_apscheduler(jobs)
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f'DROP SCHEMA IF EXISTS {SCHEMA} CASCADE'))
+        await engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--jobs', type=int, default=2_000)
+    args = parser.parse_args()
+
+    # The app's engine is the one measured, so it is pointed at the scratch
+    # schema through libpq before its first connection
+    os.environ['PGOPTIONS'] = f'-c search_path={SCHEMA},public'
+    # Per-batch log lines would swamp both the output and the timings
+    logging.disable(logging.INFO)
+    asyncio.run(run(args.jobs))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,13 +2,14 @@ import uuid
 from http import HTTPStatus
 
 from fastapi import HTTPException
-from sqlalchemy import Select
+from sqlalchemy import Select, delete, update
 
 from timebeing_backend.database import T_Session
 from timebeing_backend.models.habit import Habit
 from timebeing_backend.schemas.habit import HabitCreate, HabitSoftUpdate
 
 from ..logger import logger
+from ..pagination import paginate, split_page
 
 
 class CRUDHabit:
@@ -25,19 +26,25 @@ class CRUDHabit:
 
         session.add(db_habit)
         await session.commit()
-        await session.refresh(db_habit)
 
         return db_habit
 
     @staticmethod
-    async def list_habits(session: T_Session, user_id: str):
+    async def list_habits(
+        session: T_Session, user_id: str, cursor: str | None, limit: int
+    ):
         db_habits = await session.scalars(
-            Select(Habit).where(Habit.user_id == user_id)
+            paginate(
+                Select(Habit).where(Habit.user_id == user_id),
+                Habit,
+                cursor,
+                limit,
+            )
         )
 
         logger.info('Listou os habits do usuário %s', user_id)
 
-        return db_habits
+        return split_page(db_habits.all(), limit)
 
     @staticmethod
     async def get_habit(session: T_Session, habit_id: uuid.UUID, user_id: str):
@@ -63,11 +70,13 @@ class CRUDHabit:
     ):
         # user_email = await get_user_primary_email(user_id=user_id)
         logger.info('Deletando habit %s do usuário %s', habit_id, user_id)
-        db_habit = await session.scalar(
-            Select(Habit).where(Habit.id == habit_id, Habit.user_id == user_id)
+        deleted_id = await session.scalar(
+            delete(Habit)
+            .where(Habit.id == habit_id, Habit.user_id == user_id)
+            .returning(Habit.id)
         )
 
-        if not db_habit:
+        if not deleted_id:
             logger.warning(
                 'Habit %s não encontrado para usuário %s', habit_id, user_id
             )
@@ -75,7 +84,6 @@ class CRUDHabit:
                 status_code=HTTPStatus.NOT_FOUND, detail='habit not found'
             )
 
-        await session.delete(db_habit)
         await session.commit()
 
     @staticmethod
@@ -85,8 +93,22 @@ class CRUDHabit:
         habit: HabitSoftUpdate,
         user_id: str,
     ):
+        values = habit.model_dump(exclude_unset=True)
+        if not values:
+            return await CRUDHabit.get_habit(session, habit_id, user_id)
+
+        logger.info(
+            'Atualizando habit %s para %s do usuário %s',
+            habit_id,
+            habit.model_dump(),
+            user_id,
+        )
+
         db_habit = await session.scalar(
-            Select(Habit).where(Habit.id == habit_id, Habit.user_id == user_id)
+            update(Habit)
+            .where(Habit.id == habit_id, Habit.user_id == user_id)
+            .values(**values)
+            .returning(Habit)
         )
 
         if not db_habit:
@@ -97,18 +119,6 @@ class CRUDHabit:
                 status_code=HTTPStatus.NOT_FOUND, detail='habit not found'
             )
 
-        logger.info(
-            'Atualizando habit %s para %s do usuário %s',
-            habit_id,
-            habit.model_dump(),
-            user_id,
-        )
-
-        for key, value in habit.model_dump(exclude_unset=True).items():
-            setattr(db_habit, key, value)
-
-        session.add(db_habit)
         await session.commit()
-        await session.refresh(db_habit)
 
         return db_habit
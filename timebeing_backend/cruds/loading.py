@@ -0,0 +1,75 @@
+from enum import Enum
+
+from sqlalchemy import Select, func
+from sqlalchemy.orm import raiseload, selectinload
+
+from timebeing_backend.models.project import Project
+from timebeing_backend.models.task import Task
+
+from .task import TASK_TREE_DEPTH_LIMIT
+
+
+class TaskLoading(str, Enum):
+    """How a project query should treat ``Project.tasks``."""
+
+    # Tasks are never loaded; touching ``Project.tasks`` raises
+    none = 'none'
+    # Tasks are loaded with one extra ``IN`` query for the whole result
+    selectin = 'selectin'
+    # Only task aggregates are loaded, next to each project row
+    counts = 'counts'
+    # Tasks and their subtask trees, one ``IN`` query per tree level, as
+    # the ORM delete cascade walks ``Task.subtasks`` of every task
+    tree = 'tree'
+
+
+def project_statement(
+    user_id: str, loading: TaskLoading = TaskLoading.none
+) -> Select:
+    """
+    Build the base ``SELECT`` for a user's projects.
+
+    With ``TaskLoading.counts`` each result row is
+    ``(Project, task_count, done_count, next_due_date)``, computed by one
+    grouped aggregate over ``task``; otherwise the statement yields
+    ``Project`` entities.
+    """
+    if loading is TaskLoading.counts:
+        task_stats = (
+            Select(
+                Task.project_id,
+                func.count(Task.id).label('task_count'),
+                func.count(Task.id)
+                .filter(Task.status.is_(True))
+                .label('done_count'),
+                func.min(Task.due_date)
+                .filter(Task.status.is_(False))
+                .label('next_due_date'),
+            )
+            .where(Task.user_id == user_id, Task.project_id.is_not(None))
+            .group_by(Task.project_id)
+            .subquery()
+        )
+
+        return (
+            Select(
+                Project,
+                func.coalesce(task_stats.c.task_count, 0).label('task_count'),
+                func.coalesce(task_stats.c.done_count, 0).label('done_count'),
+                task_stats.c.next_due_date,
+            )
+            .outerjoin(task_stats, task_stats.c.project_id == Project.id)
+            .options(raiseload(Project.tasks))
+            .where(Project.user_id == user_id)
+        )
+
+    if loading is TaskLoading.tree:
+        option = selectinload(Project.tasks).selectinload(
+            Task.subtasks, recursion_depth=TASK_TREE_DEPTH_LIMIT
+        )
+    elif loading is TaskLoading.selectin:
+        option = selectinload(Project.tasks)
+    else:
+        option = raiseload(Project.tasks)
+
+    return Select(Project).options(option).where(Project.user_id == user_id)
@@ -2,17 +2,20 @@ import uuid
 from http import HTTPStatus
 
 from fastapi import HTTPException
-from sqlalchemy import Select
+from sqlalchemy import Select, delete, update
 
 from timebeing_backend.database import T_Session
 from timebeing_backend.models.project import Project
 from timebeing_backend.models.task import Task
 from timebeing_backend.schemas.project import (
     ProjectCreate,
+    ProjectPublic,
     ProjectSoftUpdate,
 )
 
 from ..logger import logger
+from ..pagination import paginate, split_page
+from .loading import TaskLoading, project_statement
 
 
 class CRUDProject:
@@ -31,7 +34,6 @@ class CRUDProject:
 
         session.add(db_project)
         await session.commit()
-        await session.refresh(db_project)
 
         return db_project
 
@@ -40,9 +42,7 @@ class CRUDProject:
         session: T_Session, project_id: uuid.UUID, user_id: str
     ):
         db_project = await session.scalar(
-            Select(Project).where(
-                Project.id == project_id, Project.user_id == user_id
-            )
+            project_statement(user_id).where(Project.id == project_id)
         )
 
         if not db_project:
@@ -58,22 +58,75 @@ class CRUDProject:
         return db_project
 
     @staticmethod
-    async def list_projects(session: T_Session, user_id: str):
-        db_projects = await session.scalars(
-            Select(Project).where(Project.user_id == user_id)
+    async def list_projects(
+        session: T_Session,
+        user_id: str,
+        cursor: str | None,
+        limit: int,
+        include_stats: bool = False,
+    ):
+        if not include_stats:
+            db_projects = await session.scalars(
+                paginate(project_statement(user_id), Project, cursor, limit)
+            )
+            logger.info('Listou projects do usuário %s', user_id)
+
+            return split_page(db_projects.all(), limit)
+
+        rows = await session.execute(
+            paginate(
+                project_statement(user_id, TaskLoading.counts),
+                Project,
+                cursor,
+                limit,
+            )
+        )
+        rows, next_cursor = split_page(
+            rows.all(), limit, entity=lambda row: row.Project
         )
-        logger.info('Listou projects do usuário %s', user_id)
 
-        return db_projects
+        db_projects = [
+            ProjectPublic.model_validate({
+                **ProjectPublic.model_validate(
+                    row.Project, from_attributes=True
+                ).model_dump(),
+                'task_count': row.task_count,
+                'done_count': row.done_count,
+                'completion_ratio': (
+                    row.done_count / row.task_count if row.task_count else 0.0
+                ),
+                'next_due_date': row.next_due_date,
+            })
+            for row in rows
+        ]
+        logger.info('Listou projects com estatísticas do usuário %s', user_id)
+
+        return db_projects, next_cursor
 
     @staticmethod
     async def delete_project(
         session: T_Session, project_id: uuid.UUID, user_id: str
     ):
         logger.info('Deletando project %s do usuário %s', project_id, user_id)
+
+        # Fast path: a project without tasks is removed in one statement
+        deleted_id = await session.scalar(
+            delete(Project)
+            .where(
+                Project.id == project_id,
+                Project.user_id == user_id,
+                ~Select(Task.id).where(Task.project_id == Project.id).exists(),
+            )
+            .returning(Project.id)
+        )
+        if deleted_id:
+            await session.commit()
+            return
+
+        # The ORM cascade needs the tasks to delete them with the project
         db_project = await session.scalar(
-            Select(Project).where(
-                Project.id == project_id, Project.user_id == user_id
+            project_statement(user_id, TaskLoading.tree).where(
+                Project.id == project_id
             )
         )
 
@@ -97,10 +150,24 @@ class CRUDProject:
         project: ProjectSoftUpdate,
         user_id: str,
     ):
-        db_project = await session.scalar(
-            Select(Project).where(
-                Project.id == project_id, Project.user_id == user_id
+        values = project.model_dump(exclude_unset=True)
+        if not values:
+            return await CRUDProject.get_project_by_id(
+                session, project_id, user_id
             )
+
+        logger.info(
+            'Atualizando project %s para %s do usuário %s',
+            project_id,
+            project.model_dump(),
+            user_id,
+        )
+
+        db_project = await session.scalar(
+            update(Project)
+            .where(Project.id == project_id, Project.user_id == user_id)
+            .values(**values)
+            .returning(Project)
         )
 
         if not db_project:
@@ -113,19 +180,7 @@ class CRUDProject:
                 status_code=HTTPStatus.NOT_FOUND, detail='Project not found'
             )
 
-        logger.info(
-            'Atualizando project %s para %s do usuário %s',
-            project_id,
-            project.model_dump(),
-            user_id,
-        )
-
-        for key, value in project.model_dump(exclude_unset=True).items():
-            setattr(db_project, key, value)
-
-        session.add(db_project)
         await session.commit()
-        await session.refresh(db_project)
 
         return db_project
 
@@ -134,9 +189,7 @@ class CRUDProject:
         session: T_Session, project_id: uuid.UUID, user_id: str
     ):
         db_project = await session.scalar(
-            Select(Project).where(
-                Project.id == project_id, Project.user_id == user_id
-            )
+            project_statement(user_id).where(Project.id == project_id)
         )
 
         if not db_project:
@@ -1,50 +1,647 @@
 import uuid
+from datetime import datetime, timedelta
 from http import HTTPStatus
 
 from fastapi import HTTPException
-from sqlalchemy import Select
+from sqlalchemy import (
+    DateTime,
+    Select,
+    and_,
+    cast,
+    delete,
+    false,
+    func,
+    insert,
+    literal_column,
+    or_,
+    true,
+    update,
+)
+from sqlalchemy.orm import aliased
 
 from timebeing_backend.database import T_Session
-from timebeing_backend.models.task import Task
-from timebeing_backend.schemas.task import TaskCreate, TaskSoftUpdate
+from timebeing_backend.models.project import Project
+from timebeing_backend.models.task import Task, TaskPriorityState
+from timebeing_backend.schemas.task import (
+    SortOrder,
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskFilters,
+    TaskSoftUpdate,
+    TaskSort,
+    TaskTree,
+)
 
+from ..agenda import free_between, merge_busy
+from ..auto_scheduler import Candidate, propose_schedule
 from ..logger import logger
-from ..scheduler.jobs import schedule_notification
+from ..pagination import SortKey, paginate, paginate_sorted, split_page
+from ..scheduler.outbox import (
+    NOTIFICATION_FIELDS,
+    enqueue_notifications,
+    reschedule_notifications,
+)
+from ..settings import settings
+
+# Guards the recursive query against parent_task_id cycles
+TASK_TREE_DEPTH_LIMIT = 50
+
+TASK_SORT_KEYS = {
+    TaskSort.created_at: SortKey(
+        'created_at', Task.created_at, Task.id, parse=datetime.fromisoformat
+    ),
+    TaskSort.updated_at: SortKey(
+        'updated_at', Task.updated_at, Task.id, parse=datetime.fromisoformat
+    ),
+    TaskSort.due_date: SortKey(
+        'due_date',
+        Task.due_date,
+        Task.id,
+        nullable=True,
+        parse=datetime.fromisoformat,
+    ),
+    TaskSort.scheduled_start_time: SortKey(
+        'scheduled_start_time',
+        Task.scheduled_start_time,
+        Task.id,
+        nullable=True,
+        parse=datetime.fromisoformat,
+    ),
+    TaskSort.priority: SortKey(
+        'priority', Task.priority, Task.id, parse=TaskPriorityState
+    ),
+    TaskSort.title: SortKey('title', Task.title, Task.id, parse=str),
+}
+
+# Same expression and predicate as ix_task_user_id_scheduled_range, so
+# overlap queries can use the GiST index
+SCHEDULED_RANGE = func.tsrange(
+    Task.scheduled_start_time, Task.scheduled_end_time
+)
+SCHEDULED = (
+    Task.scheduled_start_time.is_not(None),
+    Task.scheduled_end_time >= Task.scheduled_start_time,
+)
+# A start without an end is a zero-length interval at that start
+UNENDED = (
+    Task.scheduled_start_time.is_not(None),
+    Task.scheduled_end_time.is_(None),
+)
+SCHEDULED_END = func.coalesce(
+    Task.scheduled_end_time, Task.scheduled_start_time
+)
+SCHEDULE_FIELDS = frozenset({'scheduled_start_time', 'scheduled_end_time'})
+
+
+def _wall_time(value: datetime):
+    """
+    ``value`` as ``timestamp`` wall time, the way the columns hold it.
+
+    Postgres converts aware values with the session's ``TimeZone``, the
+    same conversion it applied when the task dates were stored.
+    """
+    return cast(value, DateTime())
+
+
+async def _window(
+    session: T_Session, start: datetime, end: datetime
+) -> tuple[datetime, datetime]:
+    start, end = (
+        await session.execute(Select(_wall_time(start), _wall_time(end)))
+    ).one()
+    if end <= start:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Invalid range'
+        )
+
+    return start, end
+
+
+def _scheduled_between(user_id: str, start: datetime, end: datetime):
+    """
+    The user's tasks whose scheduled interval overlaps ``[start, end)``,
+    and those without an end that start inside it.
+    """
+    return (
+        Select(Task)
+        .where(
+            Task.user_id == user_id,
+            or_(
+                and_(
+                    *SCHEDULED,
+                    SCHEDULED_RANGE.op('&&')(
+                        # An end before the start gives an empty range, not
+                        # an error
+                        func.tsrange(
+                            _wall_time(start),
+                            func.greatest(_wall_time(start), _wall_time(end)),
+                        )
+                    ),
+                ),
+                and_(
+                    *UNENDED,
+                    Task.scheduled_start_time >= _wall_time(start),
+                    Task.scheduled_start_time < _wall_time(end),
+                ),
+            ),
+        )
+        .order_by(Task.scheduled_start_time, Task.id)
+    )
+
+
+async def _raise_on_conflicts(session: T_Session, user_id: str, task: Task):
+    """
+    Raise 409 with the ids of the user's other tasks whose scheduled
+    interval overlaps ``task``'s. Blocks that only touch do not conflict.
+    """
+    start, end = task.scheduled_start_time, task.scheduled_end_time
+    if start is None or end is None:
+        return
+
+    conflicts = (
+        await session.scalars(
+            _scheduled_between(user_id, start, end)
+            .with_only_columns(Task.id)
+            # A zero-length interval overlaps nothing
+            .where(Task.id != task.id, Task.scheduled_end_time.is_not(None))
+        )
+    ).all()
+
+    if conflicts:
+        logger.warning(
+            'Task %s conflita com %s do usuário %s',
+            task.id,
+            conflicts,
+            user_id,
+        )
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail={
+                'message': 'Scheduling conflict',
+                'task_ids': [str(task_id) for task_id in conflicts],
+            },
+        )
+
+
+def _literal(value: bool):
+    return true() if value else false()
+
+
+def _where(filters: TaskFilters) -> list:
+    """SQL conditions for the filters that were given."""
+    conditions = []
+
+    # Booleans are inlined so the planner can match the partial indexes
+    # even under generic plans for prepared statements
+    if filters.status is not None:
+        conditions.append(Task.status == _literal(filters.status))
+    if filters.priority is not None:
+        conditions.append(Task.priority == filters.priority)
+    if filters.is_focus is not None:
+        conditions.append(Task.is_focus == _literal(filters.is_focus))
+    if filters.project_id is not None:
+        conditions.append(Task.project_id == filters.project_id)
+    if filters.has_parent is not None:
+        conditions.append(
+            Task.parent_task_id.is_not(None)
+            if filters.has_parent
+            else Task.parent_task_id.is_(None)
+        )
+    if filters.due_after is not None:
+        conditions.append(Task.due_date >= filters.due_after)
+    if filters.due_before is not None:
+        conditions.append(Task.due_date < filters.due_before)
+    if filters.scheduled_after is not None:
+        conditions.append(Task.scheduled_start_time >= filters.scheduled_after)
+    if filters.scheduled_before is not None:
+        conditions.append(Task.scheduled_start_time < filters.scheduled_before)
+
+    return conditions
+
+
+def _task_subtree(
+    user_id: str,
+    root_ids: list[uuid.UUID],
+    depth_limit: int = TASK_TREE_DEPTH_LIMIT,
+):
+    """Recursive CTE with the ids and depths of ``root_ids`` subtrees."""
+    tree = (
+        Select(Task.id, literal_column('0').label('depth'))
+        .where(Task.id.in_(root_ids), Task.user_id == user_id)
+        .cte('task_tree', recursive=True)
+    )
+
+    return tree.union_all(
+        Select(Task.id, tree.c.depth + literal_column('1'))
+        .join(tree, Task.parent_task_id == tree.c.id)
+        .where(Task.user_id == user_id, tree.c.depth < depth_limit)
+    )
+
+
+def _task_descendants(user_id: str, root_ids: list[uuid.UUID]):
+    """
+    Recursive CTE with every id of the ``root_ids`` subtrees, at any depth.
+
+    UNION rather than UNION ALL, so a cycle of parents ends the recursion.
+    """
+    tree = (
+        Select(Task.id)
+        .where(Task.id.in_(root_ids), Task.user_id == user_id)
+        .cte('task_descendants', recursive=True)
+    )
+
+    return tree.union(
+        Select(Task.id)
+        .join(tree, Task.parent_task_id == tree.c.id)
+        .where(Task.user_id == user_id)
+    )
+
+
+async def _invalid_references(
+    session: T_Session, items: list, user_id: str
+) -> dict[int, str]:
+    """
+    Map the index of each item pointing at a parent task or project the
+    user does not own to an error message, using one query per kind.
+    """
+    parent_ids = {i.parent_task_id for i in items if i.parent_task_id}
+    project_ids = {i.project_id for i in items if i.project_id}
+
+    owned_parents = set()
+    if parent_ids:
+        owned_parents = set(
+            await session.scalars(
+                Select(Task.id).where(
+                    Task.id.in_(parent_ids), Task.user_id == user_id
+                )
+            )
+        )
+
+    owned_projects = set()
+    if project_ids:
+        owned_projects = set(
+            await session.scalars(
+                Select(Project.id).where(
+                    Project.id.in_(project_ids), Project.user_id == user_id
+                )
+            )
+        )
+
+    errors = {}
+    for index, item in enumerate(items):
+        if item.parent_task_id and item.parent_task_id not in owned_parents:
+            errors[index] = 'Parent task not found'
+        elif item.project_id and item.project_id not in owned_projects:
+            errors[index] = 'Project not found'
+
+    return errors
+
+
+async def _raise_on_invalid_references(
+    session: T_Session, task: TaskCreate | TaskSoftUpdate, user_id: str
+):
+    """The single-task form of the check the bulk endpoints run."""
+    errors = await _invalid_references(session, [task], user_id)
+
+    if errors:
+        logger.warning(
+            'Referência inválida do usuário %s: %s', user_id, errors[0]
+        )
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=errors[0])
 
 
 class CRUDTask:
     @staticmethod
-    async def create_task(session: T_Session, task: TaskCreate, user_id: str):
+    async def create_task(
+        session: T_Session,
+        task: TaskCreate,
+        user_id: str,
+        check_conflicts: bool = False,
+    ):
         logger.info(
             'Criando task %s para usuário %s', task.model_dump(), user_id
         )
+        await _raise_on_invalid_references(session, task, user_id)
+
         db_task = task.model_dump()
         db_task['user_id'] = user_id
         db_task = Task(**db_task)
+        # Known up front so the outbox row can point at the new task
+        db_task.id = uuid.uuid4()
 
-        if task.due_date and task.notify_at:
-            await schedule_notification(
-                task_title=task.title,
-                due_date=task.due_date,
-                notify_at=task.notify_at,
-                user_id=user_id,
-            )
+        if check_conflicts:
+            await _raise_on_conflicts(session, user_id, db_task)
 
         session.add(db_task)
+        enqueue_notifications(session, [db_task], user_id)
         await session.commit()
-        await session.refresh(db_task)
 
         return db_task
 
     @staticmethod
-    async def list_tasks(session: T_Session, user_id: str):
-        db_tasks = await session.scalars(
-            Select(Task).where(Task.user_id == user_id)
-        )
+    async def list_tasks(
+        session: T_Session,
+        user_id: str,
+        cursor: str | None,
+        limit: int,
+        filters: TaskFilters | None = None,
+    ):
+        filters = filters or TaskFilters()
+        stmt = Select(Task).where(Task.user_id == user_id, *_where(filters))
+
+        if filters.sort is TaskSort.created_at and filters.order is (
+            SortOrder.asc
+        ):
+            # Default order keeps the (created_at, id) cursors of old pages
+            db_tasks = await session.scalars(
+                paginate(stmt, Task, cursor, limit)
+            )
+            cursor_of = None
+        else:
+            key = TASK_SORT_KEYS[filters.sort]
+            db_tasks = await session.scalars(
+                paginate_sorted(
+                    stmt,
+                    key,
+                    cursor,
+                    limit,
+                    descending=filters.order is SortOrder.desc,
+                )
+            )
+            cursor_of = key.cursor_for
 
         logger.info('Listou as tasks do usuário %s', user_id)
 
-        return db_tasks
+        return split_page(db_tasks.all(), limit, cursor_of=cursor_of)
+
+    @staticmethod
+    async def stream_tasks(session: T_Session, user_id: str, batch_size: int):
+        """
+        Yield all of a user's tasks in creation order, ``batch_size`` rows
+        at a time, through a server-side cursor.
+        """
+        logger.info('Exportando as tasks do usuário %s', user_id)
+
+        result = await session.stream_scalars(
+            Select(Task)
+            .where(Task.user_id == user_id)
+            .order_by(Task.created_at, Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        async for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    async def get_agenda(
+        session: T_Session, user_id: str, start: datetime, end: datetime
+    ):
+        """
+        Tasks scheduled to overlap ``[start, end)``, plus the busy and free
+        intervals of that window.
+        """
+        start, end = await _window(session, start, end)
+        db_tasks = (
+            await session.scalars(_scheduled_between(user_id, start, end))
+        ).all()
+
+        busy = merge_busy(
+            (
+                (
+                    task.scheduled_start_time,
+                    task.scheduled_end_time or task.scheduled_start_time,
+                )
+                for task in db_tasks
+            ),
+            start,
+            end,
+        )
+
+        logger.info('Montou a agenda do usuário %s', user_id)
+
+        return {
+            'tasks': db_tasks,
+            'busy': [{'start': s, 'end': e} for s, e in busy],
+            'free': [
+                {'start': s, 'end': e}
+                for s, e in free_between(busy, start, end)
+            ],
+        }
+
+    @staticmethod
+    async def propose_schedule(
+        session: T_Session, user_id: str, start: datetime, end: datetime
+    ):
+        """
+        Propose slots in the free time of ``[start, end)`` for the user's
+        open tasks that are not scheduled yet. Nothing is written.
+        """
+        start, end = await _window(session, start, end)
+
+        scheduled = await session.execute(
+            _scheduled_between(user_id, start, end).with_only_columns(
+                Task.scheduled_start_time, SCHEDULED_END
+            )
+        )
+        busy = merge_busy(scheduled.tuples(), start, end)
+
+        candidates = await session.execute(
+            Select(
+                Task.id,
+                Task.priority,
+                Task.created_at,
+                Task.due_date,
+                Task.duration_estimate_blocks,
+                Task.is_focus,
+            ).where(
+                Task.user_id == user_id,
+                Task.status == false(),
+                Task.scheduled_start_time.is_(None),
+            )
+        )
+
+        placements, unscheduled = propose_schedule(
+            (Candidate(*row) for row in candidates),
+            free_between(busy, start, end),
+            timedelta(minutes=settings.SCHEDULE_BLOCK_MINUTES),
+        )
+
+        logger.info(
+            'Propôs horários para %s tasks do usuário %s',
+            len(placements),
+            user_id,
+        )
+
+        return {
+            'placements': [
+                {'task_id': task_id, 'start': s, 'end': e}
+                for task_id, s, e in placements
+            ],
+            'unscheduled': unscheduled,
+        }
+
+    @staticmethod
+    async def bulk_create_tasks(
+        session: T_Session, tasks: TaskBulkCreate, user_id: str
+    ):
+        logger.info(
+            'Criando %s tasks em lote para usuário %s',
+            len(tasks.tasks),
+            user_id,
+        )
+        errors = await _invalid_references(session, tasks.tasks, user_id)
+
+        valid = [
+            (index, task)
+            for index, task in enumerate(tasks.tasks)
+            if index not in errors
+        ]
+
+        db_tasks = []
+        if valid:
+            db_tasks = (
+                await session.scalars(
+                    insert(Task).returning(Task, sort_by_parameter_order=True),
+                    [
+                        {**task.model_dump(), 'user_id': user_id}
+                        for _, task in valid
+                    ],
+                )
+            ).all()
+
+        enqueue_notifications(session, db_tasks, user_id)
+        await session.commit()
+
+        results = [
+            {
+                'index': index,
+                'status_code': HTTPStatus.NOT_FOUND,
+                'detail': detail,
+            }
+            for index, detail in errors.items()
+        ]
+        results += [
+            {
+                'index': index,
+                'status_code': HTTPStatus.CREATED,
+                'id': db_task.id,
+                'task': db_task,
+            }
+            for (index, _), db_task in zip(valid, db_tasks)
+        ]
+
+        return sorted(results, key=lambda result: result['index'])
+
+    @staticmethod
+    async def bulk_update_tasks(
+        session: T_Session, tasks: TaskBulkUpdate, user_id: str
+    ):
+        logger.info(
+            'Atualizando %s tasks em lote do usuário %s',
+            len(tasks.tasks),
+            user_id,
+        )
+        existing = set(
+            await session.scalars(
+                Select(Task.id).where(
+                    Task.id.in_({task.id for task in tasks.tasks}),
+                    Task.user_id == user_id,
+                )
+            )
+        )
+        errors = await _invalid_references(session, tasks.tasks, user_id)
+
+        changes = []
+        for index, task in enumerate(tasks.tasks):
+            if task.id not in existing:
+                errors[index] = 'Task not found'
+            elif index not in errors:
+                values = task.model_dump(exclude_unset=True)
+                if len(values) > 1:
+                    changes.append(values)
+
+        # ORM bulk UPDATE by primary key, sent as a single executemany
+        if changes:
+            await session.execute(update(Task), changes)
+
+        updated_ids = {
+            task.id
+            for index, task in enumerate(tasks.tasks)
+            if index not in errors
+        }
+        db_tasks = {}
+        if updated_ids:
+            db_tasks = {
+                db_task.id: db_task
+                for db_task in await session.scalars(
+                    Select(Task)
+                    .where(Task.id.in_(updated_ids))
+                    .execution_options(populate_existing=True)
+                )
+            }
+
+        rescheduled = {
+            values['id']
+            for values in changes
+            if values.keys() & NOTIFICATION_FIELDS
+        }
+        await reschedule_notifications(
+            session,
+            [db_tasks[task_id] for task_id in rescheduled],
+            user_id,
+        )
+        await session.commit()
+
+        return [
+            {
+                'index': index,
+                'status_code': HTTPStatus.NOT_FOUND,
+                'id': task.id,
+                'detail': errors[index],
+            }
+            if index in errors
+            else {
+                'index': index,
+                'status_code': HTTPStatus.OK,
+                'id': task.id,
+                'task': db_tasks[task.id],
+            }
+            for index, task in enumerate(tasks.tasks)
+        ]
+
+    @staticmethod
+    async def bulk_delete_tasks(
+        session: T_Session, tasks: TaskBulkDelete, user_id: str
+    ):
+        logger.info(
+            'Deletando %s tasks em lote do usuário %s', len(tasks.ids), user_id
+        )
+        # Subtasks go with their parents at any depth, as the ORM cascade
+        # does for one; a capped tree would leave rows pointing at deleted
+        # parents and fail the foreign key
+        tree = _task_descendants(user_id, tasks.ids)
+        deleted = set(
+            await session.scalars(
+                delete(Task)
+                .where(Task.id.in_(Select(tree.c.id)))
+                .returning(Task.id)
+            )
+        )
+        await session.commit()
+
+        return [
+            {'index': index, 'status_code': HTTPStatus.OK, 'id': task_id}
+            if task_id in deleted
+            else {
+                'index': index,
+                'status_code': HTTPStatus.NOT_FOUND,
+                'id': task_id,
+                'detail': 'Task not found',
+            }
+            for index, task_id in enumerate(tasks.ids)
+        ]
 
     @staticmethod
     async def get_task_by_id(
@@ -70,6 +667,25 @@ class CRUDTask:
         session: T_Session, task_id: uuid.UUID, user_id: str
     ):
         logger.info('Deletando task %s do usuário %s', task_id, user_id)
+
+        # Fast path: a task without subtasks is removed in one statement
+        subtask = aliased(Task)
+        deleted_id = await session.scalar(
+            delete(Task)
+            .where(
+                Task.id == task_id,
+                Task.user_id == user_id,
+                ~Select(subtask.id)
+                .where(subtask.parent_task_id == Task.id)
+                .exists(),
+            )
+            .returning(Task.id)
+        )
+        if deleted_id:
+            await session.commit()
+            return
+
+        # The ORM cascade walks Task.subtasks to delete the whole subtree
         db_task = await session.scalar(
             Select(Task).where(Task.id == task_id, Task.user_id == user_id)
         )
@@ -91,9 +707,25 @@ class CRUDTask:
         task_id: uuid.UUID,
         task: TaskSoftUpdate,
         user_id: str,
+        check_conflicts: bool = False,
     ):
+        values = task.model_dump(exclude_unset=True)
+        if not values:
+            return await CRUDTask.get_task_by_id(session, task_id, user_id)
+
+        logger.info(
+            'Atualizando task %s para %s do usuário %s',
+            task_id,
+            task.model_dump(),
+            user_id,
+        )
+        await _raise_on_invalid_references(session, task, user_id)
+
         db_task: Task | None = await session.scalar(
-            Select(Task).where(Task.id == task_id, Task.user_id == user_id)
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .values(**values)
+            .returning(Task)
         )
 
         if not db_task:
@@ -104,29 +736,14 @@ class CRUDTask:
                 status_code=HTTPStatus.NOT_FOUND, detail='Task not found'
             )
 
-        title_task = db_task.title
-
-        logger.info(
-            'Atualizando task %s para %s do usuário %s',
-            task_id,
-            task.model_dump(),
-            user_id,
-        )
-
-        for key, value in task.model_dump(exclude_unset=True).items():
-            setattr(db_task, key, value)
+        if check_conflicts and values.keys() & SCHEDULE_FIELDS:
+            # Checked after the update so fields left out of the patch
+            # keep their stored values; the request rolls back on 409
+            await _raise_on_conflicts(session, user_id, db_task)
 
-        if db_task.due_date and db_task.notify_at:
-            await schedule_notification(
-                task_title=title_task,
-                due_date=db_task.due_date,
-                notify_at=db_task.notify_at,
-                user_id=user_id,
-            )
-
-        session.add(db_task)
+        if values.keys() & NOTIFICATION_FIELDS:
+            await reschedule_notifications(session, [db_task], user_id)
         await session.commit()
-        await session.refresh(db_task)
 
         return db_task
 
@@ -162,3 +779,46 @@ class CRUDTask:
         )
 
         return db_subtasks
+
+    @staticmethod
+    async def get_task_tree(
+        session: T_Session,
+        task_id: uuid.UUID,
+        user_id: str,
+        max_depth: int | None = None,
+    ):
+        tree = _task_subtree(
+            user_id,
+            [task_id],
+            TASK_TREE_DEPTH_LIMIT if max_depth is None else max_depth,
+        )
+
+        db_tasks = await session.scalars(
+            Select(Task)
+            .join(tree, Task.id == tree.c.id)
+            .order_by(Task.created_at, Task.id)
+        )
+
+        nodes = {
+            db_task.id: TaskTree.model_validate(db_task)
+            for db_task in db_tasks
+        }
+
+        if task_id not in nodes:
+            logger.warning(
+                'Task %s não encontrada para usuário %s', task_id, user_id
+            )
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND, detail='Task not found'
+            )
+
+        # Rows come back in creation order, so children stay ordered too
+        for node in nodes.values():
+            if node.id != task_id and node.parent_task_id in nodes:
+                nodes[node.parent_task_id].children.append(node)
+
+        logger.info(
+            'Consultou a árvore da task %s do usuário %s', task_id, user_id
+        )
+
+        return nodes[task_id]
@@ -1,19 +1,129 @@
+import time
 from typing import Annotated
 
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import registry
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, registry
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from .pool_metrics import InstrumentedAsyncQueuePool, observe_engine
 from .settings import settings
 
 Base = registry()
 
-engine = create_async_engine(settings.DATABASE_URL)
 
+def pool_options(pool_size: int, name: str) -> dict:
+    return {
+        'pool_size': pool_size,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_timeout': settings.DB_POOL_TIMEOUT,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+        'pool_pre_ping': settings.DB_POOL_PRE_PING,
+        'pool_logging_name': name,
+    }
 
-async def get_session():
-    async with AsyncSession(engine, expire_on_commit=False) as session:
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    **pool_options(settings.DB_POOL_SIZE, 'app'),
+)
+observe_engine(engine.sync_engine, 'app')
+
+# Without a replica URL reads simply go to the primary
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_options(settings.DB_POOL_SIZE, 'replica'),
+    )
+    observe_engine(replica_engine.sync_engine, 'replica')
+else:
+    replica_engine = engine
+
+# Clients that committed within the read-your-writes window carry the
+# commit time back on every request, so whichever process serves their
+# next read keeps it on the primary until the replica has caught up
+READ_YOUR_WRITES_COOKIE = 'last_write'
+READ_YOUR_WRITES_HEADER = 'X-Last-Write'
+
+
+@event.listens_for(Session, 'after_commit')
+def _remember_write(session: Session):
+    request = session.info.get('request')
+
+    if request:
+        request.state.wrote_at = time.time()
+
+
+class ReadYourWritesMiddleware:
+    """Hand the client the time of the request's last commit."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_marker(message: Message):
+            wrote_at = scope.get('state', {}).get('wrote_at')
+
+            if message['type'] == 'http.response.start' and wrote_at:
+                marker = f'{wrote_at:.3f}'
+                headers = MutableHeaders(scope=message)
+                headers.append(READ_YOUR_WRITES_HEADER, marker)
+                headers.append(
+                    'Set-Cookie',
+                    f'{READ_YOUR_WRITES_COOKIE}={marker}; '
+                    f'Max-Age={settings.READ_YOUR_WRITES_SECONDS}; '
+                    'Path=/; HttpOnly; SameSite=lax',
+                )
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
+
+
+async def get_session(request: Request):
+    async with AsyncSession(
+        engine, expire_on_commit=False, info={'request': request}
+    ) as session:
+        yield session
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether ``request`` carries a write marker still inside the window."""
+    marker = request.headers.get(
+        READ_YOUR_WRITES_HEADER
+    ) or request.cookies.get(READ_YOUR_WRITES_COOKIE, '')
+
+    try:
+        wrote_at = float(marker)
+    except ValueError:
+        return False
+
+    return abs(time.time() - wrote_at) < settings.READ_YOUR_WRITES_SECONDS
+
+
+def read_bind(request: Request) -> AsyncEngine:
+    """Engine for ``request``'s reads, honouring read-your-writes."""
+    return engine if wrote_recently(request) else replica_engine
+
+
+async def get_read_session(request: Request):
+    async with AsyncSession(
+        read_bind(request), expire_on_commit=False
+    ) as session:
         yield session
 
 
 T_Session = Annotated[AsyncSession, Depends(get_session)]
+T_ReadSession = Annotated[AsyncSession, Depends(get_read_session)]
@@ -0,0 +1,67 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from enum import Enum
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from .cruds.task import CRUDTask
+from .schemas.task import TaskPublic
+from .settings import settings
+
+TASK = TypeAdapter(TaskPublic)
+
+
+class ExportFormat(str, Enum):
+    ndjson = 'ndjson'
+    csv = 'csv'
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: 'application/x-ndjson',
+    ExportFormat.csv: 'text/csv',
+}
+
+
+async def export_tasks(
+    user_id: str, export_format: ExportFormat, bind: AsyncEngine
+) -> AsyncIterator[bytes]:
+    """
+    Stream every task of ``user_id`` as NDJSON or CSV.
+
+    The generator owns its session on ``bind`` because the response body
+    is produced after the request's dependencies have been closed. One chunk is
+    written per ``EXPORT_YIELD_PER`` rows, so memory stays flat however
+    many tasks the user has.
+    """
+    async with AsyncSession(bind) as session:
+        batches = CRUDTask.stream_tasks(
+            session, user_id, settings.EXPORT_YIELD_PER
+        )
+
+        if export_format is ExportFormat.csv:
+            yield _csv_rows([list(TaskPublic.model_fields)])
+
+            async for tasks in batches:
+                yield _csv_rows(
+                    TASK.validate_python(task, from_attributes=True)
+                    .model_dump(mode='json')
+                    .values()
+                    for task in tasks
+                )
+        else:
+            async for tasks in batches:
+                yield b''.join(
+                    TASK.dump_json(
+                        TASK.validate_python(task, from_attributes=True)
+                    )
+                    + b'\n'
+                    for task in tasks
+                )
+
+
+def _csv_rows(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
@@ -3,8 +3,15 @@ from contextlib import asynccontextmanager
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from timebeing_backend.database import (
+    READ_YOUR_WRITES_HEADER,
+    ReadYourWritesMiddleware,
+)
 from timebeing_backend.routers import habit, project, task
+from timebeing_backend.scheduler.dispatcher import dispatcher
 from timebeing_backend.scheduler.manager import start_scheduler, stop_scheduler
+from timebeing_backend.scheduler.outbox import outbox_worker
+from timebeing_backend.scheduler.publisher import publisher
 
 from .logger import logger  # Import configured logger
 
@@ -12,10 +19,21 @@ from .logger import logger  # Import configured logger
 @asynccontextmanager
 async def lifespan(app):
     logger.info('Iniciando Aplicação')
-    start_scheduler()
+    try:
+        await publisher.start()
+    except Exception as e:
+        # Only publishing needs the broker; the publisher connects on its
+        # first publish and reports the failure per notification until then
+        logger.error('RabbitMQ indisponível ao iniciar: %s', e)
+    await dispatcher.start()
+    await start_scheduler()
+    await outbox_worker.start()
     yield
     logger.info('Encerrando Aplicação')
-    stop_scheduler()
+    await outbox_worker.stop()
+    await stop_scheduler()
+    await dispatcher.stop()
+    await publisher.stop()
 
 
 router = APIRouter(prefix='/api/v1')
@@ -27,7 +45,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=[READ_YOUR_WRITES_HEADER],
 )
+app.add_middleware(ReadYourWritesMiddleware)
 
 router.include_router(habit.router)
 router.include_router(task.router)
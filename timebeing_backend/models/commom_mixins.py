@@ -5,6 +5,10 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 
 class TimestampMixin:
+    # Fetch created_at/updated_at with RETURNING in the INSERT/UPDATE itself
+    # instead of needing a refresh SELECT after the flush
+    __mapper_args__ = {'eager_defaults': True}
+
     created_at: Mapped[datetime.datetime] = mapped_column(
         init=False, nullable=False, server_default=func.now()
     )
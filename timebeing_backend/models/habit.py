@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import UUID
+from sqlalchemy import UUID, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..database import Base
@@ -10,6 +10,9 @@ from .commom_mixins import TimestampMixin
 @Base.mapped_as_dataclass
 class Habit(TimestampMixin):
     __tablename__ = 'habit'
+    __table_args__ = (
+        Index('ix_habit_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+    )
 
     title: Mapped[str]
     description: Mapped[str] = mapped_column(nullable=True)
@@ -0,0 +1,71 @@
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import JSON, UUID, ForeignKey, Index, Interval, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import DateTime
+
+from ..database import Base
+from .task import Task
+
+
+@Base.mapped_as_dataclass
+class NotificationOutbox:
+    """
+    A notification waiting to be turned into a ``NotificationJob``.
+
+    Rows are written in the same transaction as the task they belong to and
+    drained by ``scheduler.outbox.OutboxWorker``.
+    """
+
+    __tablename__ = 'notification_outbox'
+    __table_args__ = (
+        Index('ix_notification_outbox_created_at', 'created_at'),
+    )
+
+    task_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey('task.id', ondelete='CASCADE'), nullable=False
+    )
+    user_id: Mapped[str] = mapped_column(nullable=False)
+    task_title: Mapped[str] = mapped_column(nullable=False)
+    due_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    notify_at: Mapped[timedelta] = mapped_column(Interval, nullable=False)
+    attempts: Mapped[int] = mapped_column(
+        default=0, server_default='0', nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        init=False, nullable=False, server_default=func.now()
+    )
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
+    )
+
+    # Never loaded; it makes the unit of work insert the task first when
+    # both are added in the same flush
+    task: Mapped[Task] = relationship(lazy='raise', init=False, repr=False)
+
+
+@Base.mapped_as_dataclass
+class NotificationJob:
+    """
+    A notification due at ``next_run_time``.
+
+    ``payload`` is the message published to the notifier queue, stored as
+    JSON so any process can run the job without unpickling code.
+    """
+
+    __tablename__ = 'notification_job'
+    __table_args__ = (
+        Index('ix_notification_job_next_run_time', 'next_run_time'),
+        Index('ix_notification_job_task_id', 'task_id', unique=True),
+    )
+
+    next_run_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # A task has at most one job; it goes away with the task
+    task_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey('task.id', ondelete='CASCADE'), nullable=True
+    )
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
+    )
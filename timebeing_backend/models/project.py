@@ -1,7 +1,7 @@
 import uuid
 from enum import Enum
 
-from sqlalchemy import UUID
+from sqlalchemy import UUID, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from timebeing_backend.models.task import Task
@@ -25,6 +25,11 @@ class ProjectPriorityState(str, Enum):
 @Base.mapped_as_dataclass
 class Project(TimestampMixin):
     __tablename__ = 'project'
+    __table_args__ = (
+        Index(
+            'ix_project_user_id_created_at_id', 'user_id', 'created_at', 'id'
+        ),
+    )
 
     title: Mapped[str]
     description: Mapped[str | None] = mapped_column(nullable=True)
@@ -38,6 +43,7 @@ class Project(TimestampMixin):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, init=False
     )
 
+    # Loaded explicitly per query, see cruds/loading.py
     tasks: Mapped[list['Task']] = relationship(
-        init=False, cascade='all, delete-orphan', lazy='selectin'
+        init=False, cascade='all, delete-orphan', lazy='raise'
     )
@@ -5,7 +5,15 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import UUID, Boolean, ForeignKey, Interval, Numeric
+from sqlalchemy import (
+    UUID,
+    Boolean,
+    ForeignKey,
+    Index,
+    Interval,
+    Numeric,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import DateTime
 
@@ -22,6 +30,59 @@ class TaskPriorityState(str, Enum):
 @Base.mapped_as_dataclass
 class Task(TimestampMixin):
     __tablename__ = 'task'
+    __table_args__ = (
+        Index('ix_task_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_task_user_id_project_id', 'user_id', 'project_id'),
+        Index('ix_task_user_id_parent_task_id', 'user_id', 'parent_task_id'),
+        Index('ix_task_user_id_due_date_id', 'user_id', 'due_date', 'id'),
+        # The NULL half of the nullable sorts is paged by id on its own
+        # (see pagination.paginate_sorted)
+        Index(
+            'ix_task_undated_user_id_id',
+            'user_id',
+            'id',
+            postgresql_where=text('due_date IS NULL'),
+        ),
+        Index(
+            'ix_task_unscheduled_user_id_id',
+            'user_id',
+            'id',
+            postgresql_where=text('scheduled_start_time IS NULL'),
+        ),
+        # Partial indexes for the hot list filters and sorts
+        Index(
+            'ix_task_open_user_id_due_date_id',
+            'user_id',
+            'due_date',
+            'id',
+            postgresql_where=text('status = false'),
+        ),
+        Index(
+            'ix_task_focus_user_id_created_at_id',
+            'user_id',
+            'created_at',
+            'id',
+            postgresql_where=text('is_focus = true'),
+        ),
+        Index(
+            'ix_task_scheduled_user_id_start_id',
+            'user_id',
+            'scheduled_start_time',
+            'id',
+            postgresql_where=text('scheduled_start_time IS NOT NULL'),
+        ),
+        # Overlap (&&) lookups; must match cruds.task.SCHEDULED_RANGE
+        Index(
+            'ix_task_user_id_scheduled_range',
+            'user_id',
+            text('tsrange(scheduled_start_time, scheduled_end_time)'),
+            postgresql_using='gist',
+            postgresql_where=text(
+                'scheduled_start_time IS NOT NULL '
+                'AND scheduled_end_time >= scheduled_start_time'
+            ),
+        ),
+    )
 
     title: Mapped[str]
     description: Mapped[str | None] = mapped_column(nullable=True)
@@ -0,0 +1,176 @@
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from http import HTTPStatus
+from typing import Annotated, Any
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Select, tuple_, union_all
+from sqlalchemy.orm import aliased
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+PageCursor = Annotated[str | None, Query()]
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor'
+        ) from e
+
+
+def paginate(stmt: Select, model: Any, cursor: str | None, limit: int):
+    """
+    Apply keyset pagination on ``(created_at, id)`` to ``stmt``.
+
+    One extra row is fetched so ``split_page`` can tell whether another
+    page exists without a separate COUNT.
+    """
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(model.created_at, model.id) > tuple_(created_at, id)
+        )
+
+    return stmt.order_by(model.created_at, model.id).limit(limit + 1)
+
+
+def encode_sort_cursor(sort: str, value: Any, id: uuid.UUID) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Enum):
+        value = value.value
+
+    raw = json.dumps([sort, value, str(id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_sort_cursor(
+    cursor: str, sort: str, parse: Callable[[Any], Any]
+) -> tuple[Any, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_sort, value, id = json.loads(raw)
+        # A cursor is only valid for the sort it was issued for
+        if cursor_sort != sort:
+            raise ValueError(cursor_sort)
+        return (None if value is None else parse(value)), uuid.UUID(id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor'
+        ) from e
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """A whitelisted column that a list endpoint can be sorted by."""
+
+    name: str
+    column: Any
+    id_column: Any
+    nullable: bool = False
+    # Turns the JSON value stored in a cursor back into a column value
+    parse: Callable[[Any], Any] = lambda value: value
+
+    def cursor_for(self, row: Any) -> str:
+        return encode_sort_cursor(
+            self.name, getattr(row, self.column.key), row.id
+        )
+
+
+def paginate_sorted(
+    stmt: Select,
+    key: SortKey,
+    cursor: str | None,
+    limit: int,
+    descending: bool = False,
+):
+    """
+    Apply keyset pagination on ``(key.column, id)`` to ``stmt``.
+
+    Rows with a NULL ``key.column`` come last in either direction. For a
+    nullable column the non-NULL rows and the NULL rows are paged as two
+    ``LIMIT``ed branches of a ``UNION ALL``, so each one stays a range
+    scan, read forwards or backwards: of a ``(user_id, column, id)``
+    index for the values and of a partial ``(user_id, id) WHERE column IS
+    NULL`` index for the rest.
+    """
+    column, id_column = key.column, key.id_column
+    value = id = None
+    if cursor:
+        value, id = decode_sort_cursor(cursor, key.name, key.parse)
+
+    def order(expression):
+        return expression.desc() if descending else expression.asc()
+
+    def after(expression, bound):
+        return expression < bound if descending else expression > bound
+
+    if not key.nullable:
+        if cursor:
+            stmt = stmt.where(after(tuple_(column, id_column), (value, id)))
+        return stmt.order_by(order(column), order(id_column)).limit(limit + 1)
+
+    nulls = stmt.where(column.is_(None))
+    if cursor and value is None:
+        # Already past every non-NULL value
+        return (
+            nulls.where(after(id_column, id))
+            .order_by(order(id_column))
+            .limit(limit + 1)
+        )
+
+    values = stmt.where(column.is_not(None))
+    if cursor:
+        values = values.where(after(tuple_(column, id_column), (value, id)))
+
+    branches = union_all(
+        values.order_by(order(column), order(id_column)).limit(limit + 1),
+        nulls.order_by(order(id_column)).limit(limit + 1),
+    ).subquery()
+    rows = aliased(stmt.column_descriptions[0]['entity'], branches)
+    row_column = getattr(rows, column.key)
+
+    return (
+        Select(rows)
+        .order_by(
+            order(row_column).nulls_last(),
+            order(getattr(rows, id_column.key)),
+        )
+        .limit(limit + 1)
+    )
+
+
+def split_page(
+    items: list,
+    limit: int,
+    entity: Callable[[Any], Any] = lambda x: x,
+    cursor_of: Callable[[Any], str] | None = None,
+) -> tuple[list, str | None]:
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    last = entity(items[-1])
+
+    if cursor_of is not None:
+        return items, cursor_of(last)
+
+    return items, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,84 @@
+import time
+from collections.abc import Iterable
+
+from opentelemetry import metrics
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+meter = metrics.get_meter(__name__)
+
+# Names follow the OpenTelemetry semantic conventions for DB client pools
+wait_time = meter.create_histogram(
+    'db.client.connection.wait_time',
+    unit='s',
+    description='Time it took to obtain a connection from the pool',
+)
+waits = meter.create_counter(
+    'db.client.connection.waits',
+    unit='{wait}',
+    description='Checkouts that found no idle connection and no overflow',
+)
+timeouts = meter.create_counter(
+    'db.client.connection.timeouts',
+    unit='{timeout}',
+    description='Checkouts that gave up after the pool timeout',
+)
+
+_engines: dict[str, Engine] = {}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Times every checkout and records whether it had to wait."""
+
+    def _do_get(self):
+        attributes = {'db.client.connection.pool.name': self.logging_name}
+        # As in QueuePool, a negative max_overflow means unlimited overflow
+        exhausted = (
+            self._max_overflow >= 0
+            and self.checkedin() == 0
+            and self.overflow() >= self._max_overflow
+        )
+        if exhausted:
+            waits.add(1, attributes)
+
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timeouts.add(1, attributes)
+            raise
+        finally:
+            wait_time.record(time.perf_counter() - started, attributes)
+
+
+def _observe_connections(
+    options: metrics.CallbackOptions,
+) -> Iterable[metrics.Observation]:
+    for name, engine in _engines.items():
+        # ``engine.pool`` is looked up each time since dispose() replaces it
+        pool = engine.pool
+        for state, count in (
+            ('used', pool.checkedout()),
+            ('idle', pool.checkedin()),
+        ):
+            yield metrics.Observation(
+                count,
+                {
+                    'db.client.connection.pool.name': name,
+                    'db.client.connection.state': state,
+                },
+            )
+
+
+meter.create_observable_up_down_counter(
+    'db.client.connection.count',
+    callbacks=[_observe_connections],
+    unit='{connection}',
+    description='Connections currently in use or idle in the pool',
+)
+
+
+def observe_engine(engine: Engine, name: str):
+    """Export the in-use and idle connection counts of ``engine``."""
+    _engines[name] = engine
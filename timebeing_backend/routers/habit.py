@@ -6,7 +6,9 @@ from fastapi import APIRouter
 from timebeing_backend.auth_middleware import CurrentUserId
 
 from ..cruds.habit import CRUDHabit
-from ..database import T_Session
+from ..database import T_ReadSession, T_Session
+from ..pagination import DEFAULT_PAGE_SIZE, PageCursor, PageLimit
+from ..responses import HABIT_LIST, list_response
 from ..schemas.habit import (
     HabitCreate,
     HabitList,
@@ -19,17 +21,26 @@ router = APIRouter(prefix='/habits', tags=['habits'])
 
 
 @router.get('/', status_code=HTTPStatus.OK, response_model=HabitList)
-async def list_habits(session: T_Session, user_id: CurrentUserId):
-    all_habits = await CRUDHabit.list_habits(session=session, user_id=user_id)
+async def list_habits(
+    session: T_ReadSession,
+    user_id: CurrentUserId,
+    cursor: PageCursor = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+):
+    all_habits, next_cursor = await CRUDHabit.list_habits(
+        session=session, user_id=user_id, cursor=cursor, limit=limit
+    )
 
-    return {'habits': all_habits}
+    return list_response(
+        HABIT_LIST, {'habits': all_habits, 'next_cursor': next_cursor}
+    )
 
 
 @router.get(
     '/{habit_id}', status_code=HTTPStatus.OK, response_model=HabitPublic
 )
 async def get_habit_by_id(
-    session: T_Session, habit_id: uuid.UUID, user_id: CurrentUserId
+    session: T_ReadSession, habit_id: uuid.UUID, user_id: CurrentUserId
 ):
     db_habit = await CRUDHabit.get_habit(
         session=session, habit_id=habit_id, user_id=user_id
@@ -5,8 +5,18 @@ from fastapi import APIRouter
 
 from timebeing_backend.auth_middleware import CurrentUserId
 from timebeing_backend.cruds.project import CRUDProject
-from timebeing_backend.database import T_Session
+from timebeing_backend.database import T_ReadSession, T_Session
 from timebeing_backend.models.project import ProjectStatus
+from timebeing_backend.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageCursor,
+    PageLimit,
+)
+from timebeing_backend.responses import (
+    PROJECT_LIST,
+    PROJECT_TASKS,
+    list_response,
+)
 from timebeing_backend.schemas.habit import Message
 
 from ..schemas.project import (
@@ -54,7 +64,7 @@ async def get_project_status_options():
     '/{project_id}', status_code=HTTPStatus.OK, response_model=ProjectPublic
 )
 async def get_project_by_id(
-    session: T_Session, project_id: uuid.UUID, user_id: CurrentUserId
+    session: T_ReadSession, project_id: uuid.UUID, user_id: CurrentUserId
 ):
     db_project = await CRUDProject.get_project_by_id(
         session=session, project_id=project_id, user_id=user_id
@@ -64,12 +74,24 @@ async def get_project_by_id(
 
 
 @router.get('/', status_code=HTTPStatus.OK, response_model=ProjectList)
-async def list_projects(session: T_Session, user_id: CurrentUserId):
-    db_projects = await CRUDProject.list_projects(
-        session=session, user_id=user_id
+async def list_projects(
+    session: T_ReadSession,
+    user_id: CurrentUserId,
+    cursor: PageCursor = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    include_stats: bool = False,
+):
+    db_projects, next_cursor = await CRUDProject.list_projects(
+        session=session,
+        user_id=user_id,
+        cursor=cursor,
+        limit=limit,
+        include_stats=include_stats,
     )
 
-    return {'projects': db_projects}
+    return list_response(
+        PROJECT_LIST, {'projects': db_projects, 'next_cursor': next_cursor}
+    )
 
 
 @router.get(
@@ -78,13 +100,13 @@ async def list_projects(session: T_Session, user_id: CurrentUserId):
     response_model=ProjectTasks,
 )
 async def list_tasks(
-    session: T_Session, project_id: uuid.UUID, user_id: CurrentUserId
+    session: T_ReadSession, project_id: uuid.UUID, user_id: CurrentUserId
 ):
     db_tasks = await CRUDProject.list_tasks(
         session=session, project_id=project_id, user_id=user_id
     )
 
-    return {'tasks': db_tasks}
+    return list_response(PROJECT_TASKS, {'tasks': db_tasks})
 
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=ProjectPublic)
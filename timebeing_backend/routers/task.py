@@ -1,28 +1,143 @@
 import uuid
+from datetime import datetime
 from http import HTTPStatus
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
 from timebeing_backend.auth_middleware import CurrentUserId
 from timebeing_backend.schemas.habit import Message
 
-from ..cruds.task import CRUDTask
-from ..database import T_Session
-from ..schemas.task import TaskCreate, TaskList, TaskPublic, TaskSoftUpdate
+from .. import export
+from ..cruds.task import TASK_TREE_DEPTH_LIMIT, CRUDTask
+from ..database import T_ReadSession, T_Session, read_bind
+from ..pagination import DEFAULT_PAGE_SIZE, PageCursor, PageLimit
+from ..responses import TASK_LIST, list_response
+from ..schemas.task import (
+    ScheduleProposal,
+    TaskAgenda,
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkResult,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskFilters,
+    TaskList,
+    TaskPublic,
+    TaskSoftUpdate,
+    TaskTree,
+)
 
 router = APIRouter(prefix='/tasks', tags=['tasks'])
 
 
 @router.get('/', status_code=HTTPStatus.OK, response_model=TaskList)
-async def list_tasks(session: T_Session, user_id: CurrentUserId):
-    db_tasks = await CRUDTask.list_tasks(session=session, user_id=user_id)
+async def list_tasks(
+    session: T_ReadSession,
+    user_id: CurrentUserId,
+    filters: Annotated[TaskFilters, Depends()],
+    cursor: PageCursor = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+):
+    db_tasks, next_cursor = await CRUDTask.list_tasks(
+        session=session,
+        user_id=user_id,
+        cursor=cursor,
+        limit=limit,
+        filters=filters,
+    )
+
+    return list_response(
+        TASK_LIST, {'tasks': db_tasks, 'next_cursor': next_cursor}
+    )
+
+
+@router.get('/export', status_code=HTTPStatus.OK)
+async def export_tasks(
+    request: Request,
+    user_id: CurrentUserId,
+    export_format: Annotated[
+        export.ExportFormat, Query(alias='format')
+    ] = export.ExportFormat.ndjson,
+):
+    return StreamingResponse(
+        export.export_tasks(user_id, export_format, read_bind(request)),
+        media_type=export.MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename=tasks.{export_format.value}'
+            )
+        },
+    )
+
+
+@router.get('/agenda', status_code=HTTPStatus.OK, response_model=TaskAgenda)
+async def get_agenda(
+    session: T_ReadSession,
+    user_id: CurrentUserId,
+    start: Annotated[datetime, Query(alias='from')],
+    end: Annotated[datetime, Query(alias='to')],
+):
+    return await CRUDTask.get_agenda(
+        session=session, user_id=user_id, start=start, end=end
+    )
+
+
+@router.get(
+    '/schedule', status_code=HTTPStatus.OK, response_model=ScheduleProposal
+)
+async def propose_schedule(
+    session: T_ReadSession,
+    user_id: CurrentUserId,
+    start: Annotated[datetime, Query(alias='from')],
+    end: Annotated[datetime, Query(alias='to')],
+):
+    return await CRUDTask.propose_schedule(
+        session=session, user_id=user_id, start=start, end=end
+    )
+
+
+@router.post('/bulk', status_code=HTTPStatus.OK, response_model=TaskBulkResult)
+async def bulk_create_tasks(
+    session: T_Session, tasks: TaskBulkCreate, user_id: CurrentUserId
+):
+    results = await CRUDTask.bulk_create_tasks(
+        session=session, tasks=tasks, user_id=user_id
+    )
 
-    return {'tasks': db_tasks}
+    return {'results': results}
+
+
+@router.patch(
+    '/bulk', status_code=HTTPStatus.OK, response_model=TaskBulkResult
+)
+async def bulk_update_tasks(
+    session: T_Session, tasks: TaskBulkUpdate, user_id: CurrentUserId
+):
+    results = await CRUDTask.bulk_update_tasks(
+        session=session, tasks=tasks, user_id=user_id
+    )
+
+    return {'results': results}
+
+
+@router.delete(
+    '/bulk', status_code=HTTPStatus.OK, response_model=TaskBulkResult
+)
+async def bulk_delete_tasks(
+    session: T_Session, tasks: TaskBulkDelete, user_id: CurrentUserId
+):
+    results = await CRUDTask.bulk_delete_tasks(
+        session=session, tasks=tasks, user_id=user_id
+    )
+
+    return {'results': results}
 
 
 @router.get('/{task_id}', status_code=HTTPStatus.OK, response_model=TaskPublic)
 async def get_task_by_id(
-    session: T_Session, task_id: uuid.UUID, user_id: CurrentUserId
+    session: T_ReadSession, task_id: uuid.UUID, user_id: CurrentUserId
 ):
     db_task = await CRUDTask.get_task_by_id(
         session=session, task_id=task_id, user_id=user_id
@@ -35,21 +150,45 @@ async def get_task_by_id(
     '/{task_id}/subtasks', status_code=HTTPStatus.OK, response_model=TaskList
 )
 async def list_subtasks(
-    session: T_Session, task_id: uuid.UUID, user_id: CurrentUserId
+    session: T_ReadSession, task_id: uuid.UUID, user_id: CurrentUserId
 ):
     db_subtasks = await CRUDTask.list_subtasks(
         session=session, task_id=task_id, user_id=user_id
     )
 
-    return {'tasks': db_subtasks}
+    return list_response(TASK_LIST, {'tasks': db_subtasks})
+
+
+@router.get(
+    '/{task_id}/tree', status_code=HTTPStatus.OK, response_model=TaskTree
+)
+async def get_task_tree(
+    session: T_ReadSession,
+    task_id: uuid.UUID,
+    user_id: CurrentUserId,
+    max_depth: Annotated[
+        int | None, Query(ge=0, le=TASK_TREE_DEPTH_LIMIT)
+    ] = None,
+):
+    db_tree = await CRUDTask.get_task_tree(
+        session=session, task_id=task_id, user_id=user_id, max_depth=max_depth
+    )
+
+    return db_tree
 
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=TaskPublic)
 async def create_task(
-    session: T_Session, task: TaskCreate, user_id: CurrentUserId
+    session: T_Session,
+    task: TaskCreate,
+    user_id: CurrentUserId,
+    check_conflicts: Annotated[bool, Query()] = False,
 ):
     db_task = await CRUDTask.create_task(
-        session=session, task=task, user_id=user_id
+        session=session,
+        task=task,
+        user_id=user_id,
+        check_conflicts=check_conflicts,
     )
 
     return db_task
@@ -74,9 +213,14 @@ async def soft_update_task(
     task_id: uuid.UUID,
     task: TaskSoftUpdate,
     user_id: CurrentUserId,
+    check_conflicts: Annotated[bool, Query()] = False,
 ):
     db_task = await CRUDTask.soft_update_task(
-        session=session, task_id=task_id, task=task, user_id=user_id
+        session=session,
+        task_id=task_id,
+        task=task,
+        user_id=user_id,
+        check_conflicts=check_conflicts,
     )
 
     return db_task
@@ -0,0 +1,136 @@
+import asyncio
+
+from ..logger import logger
+from ..settings import settings
+from .publisher import RabbitMQPublisher, publisher
+
+
+class NotificationDispatcher:
+    """
+    Groups notifications that fire within a short window into batches.
+
+    Each batch is published on a single confirm channel and its confirms
+    are awaited together. Messages the broker did not confirm are retried
+    up to ``max_retries`` times before the caller sees the error.
+    """
+
+    def __init__(
+        self,
+        publisher: RabbitMQPublisher,
+        batch_size: int,
+        linger_seconds: float,
+        max_retries: int,
+    ):
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        self.max_retries = max_retries
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        if not self.is_running:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self.is_running:
+            return
+
+        # The sentinel lets the worker flush what is already queued
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+
+    async def dispatch(self, data: dict):
+        if not self.is_running:
+            await self.publisher.publish(data)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((data, future))
+        await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.linger_seconds
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+
+                if item is None:
+                    stopping = True
+                    break
+
+                batch.append(item)
+
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                # The worker has to outlive a failed batch, and its callers
+                # must not wait forever on futures nobody will resolve
+                logger.exception('Falha ao publicar lote de notificações')
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _flush(self, batch: list[tuple[dict, asyncio.Future]]):
+        pending = batch
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(0.5 * attempt)
+
+            errors = await self.publisher.publish_batch([
+                data for data, _ in pending
+            ])
+
+            failed = []
+            for (data, future), error in zip(pending, errors):
+                if error is None:
+                    if not future.done():
+                        future.set_result(None)
+                else:
+                    failed.append(((data, future), error))
+
+            if not failed:
+                return
+
+            logger.warning(
+                'Falha ao publicar %s de %s notificações (tentativa %s)',
+                len(failed),
+                len(pending),
+                attempt + 1,
+            )
+            pending = [item for item, _ in failed]
+
+        for (_, future), error in failed:
+            if not future.done():
+                future.set_exception(error)
+
+
+dispatcher = NotificationDispatcher(
+    publisher=publisher,
+    batch_size=settings.NOTIFICATION_BATCH_SIZE,
+    linger_seconds=settings.NOTIFICATION_BATCH_LINGER_MS / 1000,
+    max_retries=settings.NOTIFICATION_PUBLISH_RETRIES,
+)
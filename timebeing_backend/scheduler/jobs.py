@@ -1,43 +1,77 @@
-import json
-from datetime import datetime, timedelta
+import uuid
 
-import aio_pika
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..auth_middleware import get_user_primary_email
-from ..settings import settings
-from .manager import scheduler
+from ..models.notification import NotificationJob, NotificationOutbox
+from .dispatcher import dispatcher
+from .messages import NotificationMessage
 
 
 async def send_task_to_rabbitmq(task_data: dict):
-    connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
-    channel = await connection.channel()
-    queue = await channel.declare_queue('notifier', durable=True)
-    message = aio_pika.Message(body=json.dumps(task_data).encode())
-    await channel.default_exchange.publish(message, routing_key=queue.name)
-    await connection.close()
+    await dispatcher.dispatch(task_data)
 
 
-async def schedule_notification(
-    task_title: str, due_date: datetime, notify_at: timedelta, user_id: str
-):
-    run_time = due_date - notify_at
+def notification_job(
+    row: NotificationOutbox, user_email: str, due_at: int
+) -> dict:
+    """
+    Build the ``notification_job`` values for an outbox row.
+
+    ``due_at`` is ``row.due_date`` in epoch seconds, computed by Postgres
+    (see ``outbox.DUE_AT``) with the time zone the date was stored in.
+    """
+    message = NotificationMessage(
+        task_id=row.task_id,
+        user_id=row.user_id,
+        title=row.task_title,
+        email=user_email,
+        due_at=due_at,
+        notify_at=row.notify_at,
+    )
+
+    return {
+        'task_id': row.task_id,
+        'next_run_time': row.due_date - row.notify_at,
+        'payload': message.model_dump(mode='json'),
+    }
 
-    user_email = await get_user_primary_email(user_id=user_id)
 
-    scheduler.add_job(
-        send_notification_job,
-        trigger='date',
-        run_date=run_time,
-        args=[task_title, notify_at, user_email],
-        replace_existing=True,
+async def add_notification_jobs(session: AsyncSession, jobs: list[dict]):
+    """
+    Schedule ``jobs`` once the caller commits.
+
+    Jobs are keyed by task, so scheduling a task that already has a job
+    moves that job instead of adding a second one.
+    """
+    if not jobs:
+        return
+
+    stmt = insert(NotificationJob)
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[NotificationJob.task_id],
+            set_={
+                'next_run_time': stmt.excluded.next_run_time,
+                'payload': stmt.excluded.payload,
+            },
+        ),
+        jobs,
     )
+    session.info['notification_jobs'] = True
 
 
-async def send_notification_job(
-    task_title: str, notify_at: timedelta, user_email: str
+async def remove_notification_jobs(
+    session: AsyncSession, task_ids: list[uuid.UUID]
 ):
-    await send_task_to_rabbitmq({
-        'title': f'{task_title}',
-        'email': f'{user_email}',
-        'notify_at': f'{notify_at}',
-    })
+    if task_ids:
+        await session.execute(
+            delete(NotificationJob).where(
+                NotificationJob.task_id.in_(task_ids)
+            )
+        )
+
+
+async def send_notification_job(payload: dict):
+    await send_task_to_rabbitmq(payload)
@@ -0,0 +1,69 @@
+from sqlalchemy import Select, func
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from ..logger import logger
+
+
+class AdvisoryLock:
+    """
+    Session-level Postgres advisory lock held on a dedicated connection.
+
+    Whoever holds the lock is the leader. If the leader process dies, its
+    connection closes and Postgres releases the lock, so another process
+    takes over on its next ``acquire``.
+    """
+
+    def __init__(self, engine: AsyncEngine, key: int):
+        self.engine = engine
+        self.key = key
+
+        self._connection: AsyncConnection | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._connection is not None
+
+    async def acquire(self) -> bool:
+        """Take the lock if it is free, without waiting for it."""
+        if self.held:
+            return await self._still_held()
+
+        connection = await self.engine.connect()
+        try:
+            # Autocommit so the connection is never idle in transaction
+            await connection.execution_options(isolation_level='AUTOCOMMIT')
+            acquired = await connection.scalar(
+                Select(func.pg_try_advisory_lock(self.key))
+            )
+        except Exception:
+            await connection.close()
+            raise
+
+        if not acquired:
+            await connection.close()
+            return False
+
+        logger.info('Lock %s adquirido, assumindo como líder', self.key)
+        self._connection = connection
+        return True
+
+    async def release(self):
+        if not self.held:
+            return
+
+        connection, self._connection = self._connection, None
+        try:
+            await connection.scalar(Select(func.pg_advisory_unlock(self.key)))
+        finally:
+            await connection.close()
+
+    async def _still_held(self) -> bool:
+        try:
+            await self._connection.scalar(Select(1))
+        except Exception:
+            logger.warning('Conexão do lock %s perdida', self.key)
+            connection, self._connection = self._connection, None
+            await connection.invalidate()
+            return False
+
+        return True
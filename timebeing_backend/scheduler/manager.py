@@ -1,17 +1,188 @@
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import asyncio
 
+from sqlalchemy import Select, delete, event, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import engine
+from ..logger import logger
+from ..models.notification import NotificationJob
 from ..settings import settings
+from .jobs import send_notification_job
+from .leader import AdvisoryLock
+
+# Arbitrary, only has to be unique among the app's advisory locks
+SCHEDULER_LOCK_KEY = 7_312_894_001
+
+
+@event.listens_for(Session, 'after_commit')
+def _wake_scheduler(session: Session):
+    if session.info.pop('notification_jobs', False):
+        scheduler.notify()
+
+
+class NotificationScheduler:
+    """
+    Runs the ``notification_job`` rows whose ``next_run_time`` has passed.
+
+    ``next_run_time`` is wall time of the database session, so it is only
+    ever compared with the database clock (``LOCALTIMESTAMP``), never with
+    this process's.
+
+    Due jobs are claimed with ``FOR UPDATE SKIP LOCKED`` on the app's async
+    engine, so every replica can run this loop without firing a job twice.
+    Between batches it sleeps until the next job is due, at most
+    ``max_sleep_seconds`` so jobs added by other processes are noticed.
+
+    With a ``leader_lock`` only the process holding it polls; the others
+    retry the lock every ``leader_retry_seconds``, which bounds failover.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_sleep_seconds: float,
+        leader_lock: AdvisoryLock | None = None,
+        leader_retry_seconds: float = 10,
+    ):
+        self.batch_size = batch_size
+        self.max_sleep_seconds = max_sleep_seconds
+        self.leader_lock = leader_lock
+        self.leader_retry_seconds = leader_retry_seconds
+
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        if not self.running:
+            self._stopping = False
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self.running:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        await self._worker
+        self._worker = None
+
+        if self.leader_lock is not None:
+            await self.leader_lock.release()
+
+    def notify(self):
+        """Re-check the next due time, e.g. after jobs were added."""
+        self._wakeup.set()
+
+    async def _run(self):
+        while not self._stopping:
+            self._wakeup.clear()
+
+            try:
+                if await self._is_leader():
+                    fired = await self.run_due_jobs()
+                    if fired >= self.batch_size:
+                        continue
+                    delay = await self._seconds_until_next_job()
+                else:
+                    delay = self.leader_retry_seconds
+            except Exception:
+                logger.exception('Falha ao executar jobs de notificação')
+                delay = self.max_sleep_seconds
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except TimeoutError:
+                pass
+
+    async def _is_leader(self) -> bool:
+        if self.leader_lock is None:
+            return True
+
+        return await self.leader_lock.acquire()
+
+    async def run_due_jobs(self) -> int:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            jobs = (
+                await session.scalars(
+                    Select(NotificationJob)
+                    .where(
+                        NotificationJob.next_run_time <= func.localtimestamp()
+                    )
+                    .order_by(NotificationJob.next_run_time)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+
+            if not jobs:
+                return 0
+
+            results = await asyncio.gather(
+                *(send_notification_job(job.payload) for job in jobs),
+                return_exceptions=True,
+            )
+            for job, result in zip(jobs, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        'Job de notificação %s falhou: %s', job.id, result
+                    )
+
+            # Like APScheduler's date trigger, a job runs once either way
+            await session.execute(
+                delete(NotificationJob).where(
+                    NotificationJob.id.in_([job.id for job in jobs])
+                )
+            )
+            await session.commit()
+
+            logger.info('Executou %s jobs de notificação', len(jobs))
+
+            return len(jobs)
+
+    async def _seconds_until_next_job(self) -> float:
+        max_sleep = self.max_sleep_seconds
+        if self.leader_lock is not None:
+            # The leader re-checks its lock at the same pace followers retry
+            max_sleep = min(max_sleep, self.leader_retry_seconds)
+
+        async with AsyncSession(engine) as session:
+            delay = await session.scalar(
+                Select(
+                    func.extract(
+                        'epoch',
+                        func.min(NotificationJob.next_run_time)
+                        - func.localtimestamp(),
+                    )
+                )
+            )
+
+        if delay is None:
+            return max_sleep
+
+        return min(max(float(delay), 0), max_sleep)
+
 
-jobstores = {'default': SQLAlchemyJobStore(url=settings.DATABASE_URL)}
-scheduler = AsyncIOScheduler(jobstores=jobstores)
+scheduler = NotificationScheduler(
+    batch_size=settings.SCHEDULER_BATCH_SIZE,
+    max_sleep_seconds=settings.SCHEDULER_MAX_SLEEP_SECONDS,
+    leader_lock=(
+        AdvisoryLock(engine, SCHEDULER_LOCK_KEY)
+        if settings.SCHEDULER_LEADER_ELECTION
+        else None
+    ),
+    leader_retry_seconds=settings.SCHEDULER_LEADER_RETRY_SECONDS,
+)
 
 
-def start_scheduler():
-    if not scheduler.running:
-        scheduler.start()
+async def start_scheduler():
+    await scheduler.start()
 
 
-def stop_scheduler():
-    if scheduler.running:
-        scheduler.shutdown()
+async def stop_scheduler():
+    await scheduler.stop()
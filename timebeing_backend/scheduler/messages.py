@@ -0,0 +1,62 @@
+import json
+import uuid
+from datetime import timedelta
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+SCHEMA_VERSION = 1
+
+CONTENT_TYPES = {
+    'legacy': 'application/json',
+    'v1': 'application/vnd.timebeing.notification.v1+json',
+}
+
+
+class NotificationMessage(BaseModel):
+    """
+    Version 1 of the message published to the ``notifier`` queue.
+
+    ``task_id`` plus ``due_at`` identify a reminder, so consumers can drop
+    redeliveries. ``notify_at`` travels as an ISO 8601 duration.
+    """
+
+    model_config = ConfigDict(ser_json_timedelta='iso8601')
+
+    v: Literal[1] = SCHEMA_VERSION
+    task_id: uuid.UUID
+    user_id: str
+    title: str
+    email: str
+    due_at: int
+    notify_at: timedelta
+
+
+def encode_notification(
+    payload: dict, wire_format: str
+) -> tuple[bytes, str, dict]:
+    """
+    Encode a stored job payload for the broker.
+
+    Returns:
+        tuple: The body, its content type and the AMQP headers
+    """
+    if 'v' not in payload:
+        # Jobs stored before the payload was versioned
+        return json.dumps(payload).encode(), CONTENT_TYPES['legacy'], {}
+
+    message = NotificationMessage.model_validate(payload)
+
+    if wire_format == 'v1':
+        return (
+            message.model_dump_json().encode(),
+            CONTENT_TYPES['v1'],
+            {'x-schema-version': SCHEMA_VERSION},
+        )
+
+    legacy = {
+        'title': f'{message.title}',
+        'email': f'{message.email}',
+        'notify_at': f'{message.notify_at}',
+    }
+    return json.dumps(legacy).encode(), CONTENT_TYPES['legacy'], {}
@@ -0,0 +1,254 @@
+import asyncio
+
+from sqlalchemy import DateTime, Select, cast, delete, event, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..auth_middleware import get_user_primary_email
+from ..database import engine
+from ..logger import logger
+from ..models.notification import NotificationOutbox
+from ..settings import settings
+from .jobs import (
+    add_notification_jobs,
+    notification_job,
+    remove_notification_jobs,
+)
+
+# Task fields a notification job depends on
+NOTIFICATION_FIELDS = frozenset({'title', 'due_date', 'notify_at', 'status'})
+
+# The naive due date read back as timestamptz, i.e. in the session time
+# zone it was converted to on the way in, then as epoch seconds
+DUE_AT = func.extract(
+    'epoch', cast(NotificationOutbox.due_date, DateTime(timezone=True))
+)
+
+
+def _wants_notification(task) -> bool:
+    return bool(task.due_date and task.notify_at and not task.status)
+
+
+def enqueue_notifications(session: AsyncSession, tasks: list, user_id: str):
+    """
+    Queue the notifications of new ``tasks`` in the caller's transaction.
+
+    Nothing leaves the database here: the rows become visible to the
+    ``OutboxWorker`` only once the caller commits.
+    """
+    rows = [
+        NotificationOutbox(
+            task_id=task.id,
+            user_id=user_id,
+            task_title=task.title,
+            due_date=task.due_date,
+            notify_at=task.notify_at,
+        )
+        for task in tasks
+        if _wants_notification(task)
+    ]
+
+    if rows:
+        session.add_all(rows)
+        session.info['notification_outbox'] = True
+
+
+async def reschedule_notifications(
+    session: AsyncSession, tasks: list, user_id: str
+):
+    """
+    Bring the notifications of updated ``tasks`` in line with them.
+
+    Pending outbox rows are replaced, and the jobs of tasks that were
+    completed or lost their due date are removed right away. The others are
+    moved in place by the worker.
+    """
+    if not tasks:
+        return
+
+    await session.execute(
+        delete(NotificationOutbox).where(
+            NotificationOutbox.task_id.in_([task.id for task in tasks])
+        )
+    )
+    await remove_notification_jobs(
+        session, [task.id for task in tasks if not _wants_notification(task)]
+    )
+    enqueue_notifications(session, tasks, user_id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _wake_outbox_worker(session: Session):
+    if session.info.pop('notification_outbox', False):
+        outbox_worker.notify()
+
+
+class OutboxWorker:
+    """
+    Drains ``notification_outbox`` into the scheduler in batches.
+
+    Emails are resolved once per user in the batch, before any row is
+    locked. The rows are then claimed with ``FOR UPDATE SKIP LOCKED``, so
+    several app processes can drain the table at the same time, and the
+    jobs are written in the same short transaction that deletes them.
+    Rows whose email lookup fails are retried until ``max_attempts``.
+    """
+
+    def __init__(
+        self, batch_size: int, poll_seconds: float, max_attempts: int
+    ):
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        if not self.is_running:
+            self._stopping = False
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self.is_running:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        await self._worker
+        self._worker = None
+
+    def notify(self):
+        """Wake the worker now instead of at the next poll."""
+        self._wakeup.set()
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                drained = await self.drain()
+            except Exception:
+                logger.exception('Falha ao processar a outbox de notificações')
+                drained = 0
+
+            # A full batch means there is probably more waiting
+            if drained >= self.batch_size:
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def drain(self) -> int:
+        # Read the batch without locking it: emails are resolved before
+        # any row is locked, so request-path DELETEs on the outbox never
+        # wait on Clerk
+        async with AsyncSession(engine) as session:
+            pending = (
+                await session.execute(
+                    Select(NotificationOutbox.id, NotificationOutbox.user_id)
+                    .order_by(NotificationOutbox.created_at)
+                    .limit(self.batch_size)
+                )
+            ).all()
+
+        if not pending:
+            return 0
+
+        emails = await self._resolve_emails({
+            user_id for _, user_id in pending
+        })
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            # Rows replaced or claimed by another worker in the meantime
+            # are gone or locked, and are left to whoever owns them now
+            claimed = (
+                await session.execute(
+                    Select(NotificationOutbox, DUE_AT)
+                    .where(
+                        NotificationOutbox.id.in_([id for id, _ in pending])
+                    )
+                    .order_by(NotificationOutbox.created_at)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+
+            rows = [row for row, _ in claimed]
+            due_at = {row.id: int(epoch) for row, epoch in claimed}
+            ready = [row for row in rows if row.user_id in emails]
+
+            # Rows come oldest first, so the latest one per task wins
+            jobs = {
+                row.task_id: notification_job(
+                    row, emails[row.user_id], due_at[row.id]
+                )
+                for row in ready
+            }
+            await add_notification_jobs(session, list(jobs.values()))
+
+            retry = {
+                row.id
+                for row in rows
+                if row.user_id not in emails
+                and row.attempts + 1 < self.max_attempts
+            }
+            done = [row.id for row in rows if row.id not in retry]
+
+            if len(done) > len(ready):
+                logger.error(
+                    'Descartando %s notificações após %s tentativas',
+                    len(done) - len(ready),
+                    self.max_attempts,
+                )
+
+            await session.execute(
+                delete(NotificationOutbox).where(
+                    NotificationOutbox.id.in_(done)
+                )
+            )
+            if retry:
+                await session.execute(
+                    update(NotificationOutbox)
+                    .where(NotificationOutbox.id.in_(retry))
+                    .values(attempts=NotificationOutbox.attempts + 1)
+                )
+            await session.commit()
+
+        logger.info('Registrou %s notificações da outbox', len(ready))
+
+        return len(pending)
+
+    @staticmethod
+    async def _resolve_emails(user_ids: set[str]) -> dict[str, str]:
+        """Primary email of each user whose lookup succeeded."""
+        user_ids = list(user_ids)
+        lookups = await asyncio.gather(
+            *(get_user_primary_email(user_id) for user_id in user_ids),
+            return_exceptions=True,
+        )
+
+        emails = {}
+        for user_id, lookup in zip(user_ids, lookups):
+            if isinstance(lookup, BaseException):
+                logger.warning(
+                    'Falha ao buscar email do usuário %s: %s',
+                    user_id,
+                    lookup,
+                )
+            else:
+                emails[user_id] = lookup
+
+        return emails
+
+
+outbox_worker = OutboxWorker(
+    batch_size=settings.NOTIFICATION_OUTBOX_BATCH_SIZE,
+    poll_seconds=settings.NOTIFICATION_OUTBOX_POLL_SECONDS,
+    max_attempts=settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+)
@@ -0,0 +1,169 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
+
+from ..logger import logger
+from ..settings import settings
+from .messages import encode_notification
+
+
+@dataclass
+class PublisherMetrics:
+    published: int = 0
+    failed: int = 0
+    reconnects: int = 0
+    last_reconnect_at: datetime | None = None
+
+
+class RabbitMQPublisher:
+    """
+    Long-lived RabbitMQ publisher.
+
+    Keeps one robust connection and a pool of channels open for the whole
+    application lifetime, so each notification costs a single publish
+    instead of a full TCP + AMQP handshake.
+    """
+
+    def __init__(
+        self, url: str, queue_name: str, pool_size: int, wire_format: str
+    ):
+        self.url = url
+        self.queue_name = queue_name
+        self.pool_size = pool_size
+        self.wire_format = wire_format
+        self.metrics = PublisherMetrics()
+
+        self._connection: AbstractRobustConnection | None = None
+        self._channels: Pool[AbstractChannel] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed
+
+    async def start(self):
+        async with self._lock:
+            if self.is_running:
+                return
+
+            logger.info('Conectando publisher ao RabbitMQ')
+            connection = await aio_pika.connect_robust(self.url)
+
+            # Declare the queue a single time; the pooled channels only publish
+            try:
+                async with connection.channel() as channel:
+                    await channel.declare_queue(self.queue_name, durable=True)
+            except Exception:
+                # Not running yet, so the next publish starts over
+                await connection.close()
+                raise
+
+            connection.reconnect_callbacks.add(self._on_reconnect)
+            self._connection = connection
+            self._channels = Pool(self._open_channel, max_size=self.pool_size)
+
+    async def stop(self):
+        async with self._lock:
+            if self._channels is not None:
+                await self._channels.close()
+                self._channels = None
+
+            if self._connection is not None:
+                await self._connection.close()
+                self._connection = None
+
+            logger.info(
+                'Publisher RabbitMQ encerrado: %s publicadas, %s falhas, '
+                '%s reconexões',
+                self.metrics.published,
+                self.metrics.failed,
+                self.metrics.reconnects,
+            )
+
+    async def publish(self, data: dict):
+        try:
+            if not self.is_running:
+                await self.start()
+
+            async with self._channels.acquire() as channel:
+                await self._publish_on(channel, data)
+        except Exception:
+            self.metrics.failed += 1
+            raise
+
+        self.metrics.published += 1
+
+    async def publish_batch(
+        self, items: list[dict]
+    ) -> list[BaseException | None]:
+        """
+        Publish every item on a single confirm channel.
+
+        All messages are written before any confirm is awaited, so the
+        broker acks the batch as a group instead of one round trip per
+        message.
+
+        Returns:
+            list: ``None`` for each confirmed item, or the exception that
+            made it fail, in the same order as ``items``. An unreachable
+            broker fails every item instead of raising
+        """
+        try:
+            if not self.is_running:
+                await self.start()
+
+            async with self._channels.acquire() as channel:
+                results = await asyncio.gather(
+                    *(self._publish_on(channel, data) for data in items),
+                    return_exceptions=True,
+                )
+        except Exception as e:
+            results = [e] * len(items)
+
+        errors = [
+            result if isinstance(result, BaseException) else None
+            for result in results
+        ]
+        failed = sum(error is not None for error in errors)
+        self.metrics.failed += failed
+        self.metrics.published += len(items) - failed
+
+        return errors
+
+    async def _publish_on(self, channel: AbstractChannel, data: dict):
+        # Built inside the coroutine, so a payload that does not encode
+        # fails on its own instead of taking its batch down with it
+        await channel.default_exchange.publish(
+            self._build_message(data), routing_key=self.queue_name
+        )
+
+    def _build_message(self, data: dict) -> aio_pika.Message:
+        body, content_type, headers = encode_notification(
+            data, self.wire_format
+        )
+        return aio_pika.Message(
+            body=body, content_type=content_type, headers=headers
+        )
+
+    async def _open_channel(self) -> AbstractChannel:
+        return await self._connection.channel(publisher_confirms=True)
+
+    def _on_reconnect(self, *_):
+        self.metrics.reconnects += 1
+        self.metrics.last_reconnect_at = datetime.now(timezone.utc)
+        logger.warning(
+            'Publisher reconectado ao RabbitMQ (%s reconexões)',
+            self.metrics.reconnects,
+        )
+
+
+publisher = RabbitMQPublisher(
+    url=settings.RABBITMQ_URL,
+    queue_name='notifier',
+    pool_size=settings.RABBITMQ_CHANNEL_POOL_SIZE,
+    wire_format=settings.NOTIFICATION_WIRE_FORMAT,
+)
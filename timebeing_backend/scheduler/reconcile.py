@@ -0,0 +1,122 @@
+"""
+Bring ``notification_job`` back in line with the tasks.
+
+Removes jobs of tasks that were completed or lost their due date, and
+queues an outbox row for every pending task whose job is missing or out
+of date. Run it with ``task reconcile``.
+"""
+
+import asyncio
+
+from sqlalchemy import Select, delete, func, insert, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import engine
+from ..logger import logger
+from ..models.notification import NotificationJob, NotificationOutbox
+from ..models.task import Task
+
+
+async def _count_jobs(session: AsyncSession) -> int:
+    return await session.scalar(
+        Select(func.count()).select_from(NotificationJob)
+    )
+
+
+async def reconcile() -> dict[str, int]:
+    async with AsyncSession(engine) as session:
+        before = await _count_jobs(session)
+
+        removed = len(
+            (
+                await session.scalars(
+                    delete(NotificationJob)
+                    .where(
+                        NotificationJob.task_id.in_(
+                            Select(Task.id).where(
+                                or_(
+                                    Task.status.is_(True),
+                                    Task.due_date.is_(None),
+                                    Task.notify_at.is_(None),
+                                )
+                            )
+                        )
+                    )
+                    .returning(NotificationJob.id)
+                )
+            ).all()
+        )
+
+        up_to_date = Select(NotificationJob.id).where(
+            NotificationJob.task_id == Task.id,
+            NotificationJob.next_run_time == Task.due_date - Task.notify_at,
+        )
+        queued = Select(NotificationOutbox.id).where(
+            NotificationOutbox.task_id == Task.id
+        )
+        requeued = len(
+            (
+                await session.scalars(
+                    insert(NotificationOutbox)
+                    .from_select(
+                        [
+                            'id',
+                            'task_id',
+                            'user_id',
+                            'task_title',
+                            'due_date',
+                            'notify_at',
+                        ],
+                        # A per-row id; the model's uuid4 default would
+                        # be bound once and shared by every row
+                        Select(
+                            func.gen_random_uuid(),
+                            Task.id,
+                            Task.user_id,
+                            Task.title,
+                            Task.due_date,
+                            Task.notify_at,
+                        ).where(
+                            Task.status.is_(False),
+                            Task.due_date - Task.notify_at
+                            > func.localtimestamp(),
+                            ~up_to_date.exists(),
+                            ~queued.exists(),
+                        ),
+                    )
+                    .returning(NotificationOutbox.task_id)
+                )
+            ).all()
+        )
+
+        # Jobs from before they were keyed by task still fire once
+        legacy = await session.scalar(
+            Select(func.count())
+            .select_from(NotificationJob)
+            .where(NotificationJob.task_id.is_(None))
+        )
+        after = await _count_jobs(session)
+
+        await session.commit()
+
+    return {
+        'before': before,
+        'removed': removed,
+        'requeued': requeued,
+        'legacy': legacy,
+        'after': after,
+    }
+
+
+async def main():
+    report = await reconcile()
+    logger.info(
+        'Reconciliação de jobs: %(before)s antes, %(removed)s removidos, '
+        '%(requeued)s reenfileirados, %(legacy)s sem task, %(after)s depois',
+        report,
+    )
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -20,6 +20,7 @@ class HabitPublic(HabitCreate):
 
 class HabitList(BaseModel):
     habits: list[HabitPublic]
+    next_cursor: str | None = None
 
 
 class HabitSoftUpdate(BaseModel):
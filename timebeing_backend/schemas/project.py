@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from timebeing_backend.models.project import (
     ProjectPriorityState,
@@ -28,10 +29,29 @@ class ProjectPublic(BaseModel):
     created_at: datetime
     updated_at: datetime
     ai_context_text: str | None
+    # Only filled when the list is requested with include_stats
+    task_count: int | None = None
+    done_count: int | None = None
+    completion_ratio: float | None = None
+    next_due_date: datetime | None = None
+
+    @field_validator('next_due_date', mode='before')
+    def ensure_brazil_timezone(cls, v):
+        if v is None:
+            return v
+
+        if isinstance(v, str):
+            v = datetime.fromisoformat(v)
+
+        if v.tzinfo:
+            return v.astimezone(ZoneInfo('America/Sao_Paulo'))
+
+        return v.replace(tzinfo=ZoneInfo('America/Sao_Paulo'))
 
 
 class ProjectList(BaseModel):
     projects: list[ProjectPublic]
+    next_cursor: str | None = None
 
 
 class ProjectSoftUpdate(BaseModel):
@@ -1,9 +1,10 @@
 import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
+from enum import Enum
 from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from timebeing_backend.models.task import TaskPriorityState
 
@@ -76,8 +77,65 @@ class TaskPublic(BaseModel):
         return v.replace(tzinfo=ZoneInfo('America/Sao_Paulo'))
 
 
+class TaskTree(TaskPublic):
+    model_config = ConfigDict(from_attributes=True)
+
+    children: list['TaskTree'] = Field(default_factory=list)
+
+
+class TaskSort(str, Enum):
+    created_at = 'created_at'
+    updated_at = 'updated_at'
+    due_date = 'due_date'
+    scheduled_start_time = 'scheduled_start_time'
+    priority = 'priority'
+    title = 'title'
+
+
+class SortOrder(str, Enum):
+    asc = 'asc'
+    desc = 'desc'
+
+
+class TaskFilters(BaseModel):
+    status: bool | None = None
+    priority: TaskPriorityState | None = None
+    is_focus: bool | None = None
+    project_id: uuid.UUID | None = None
+    has_parent: bool | None = None
+    due_after: datetime | None = None
+    due_before: datetime | None = None
+    scheduled_after: datetime | None = None
+    scheduled_before: datetime | None = None
+    sort: TaskSort = TaskSort.created_at
+    order: SortOrder = SortOrder.asc
+
+
+class TimeInterval(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class TaskAgenda(BaseModel):
+    tasks: list[TaskPublic]
+    busy: list[TimeInterval]
+    free: list[TimeInterval]
+
+
+class TaskPlacement(BaseModel):
+    task_id: uuid.UUID
+    start: datetime
+    end: datetime
+
+
+class ScheduleProposal(BaseModel):
+    placements: list[TaskPlacement]
+    unscheduled: list[uuid.UUID]
+
+
 class TaskList(BaseModel):
     tasks: list[TaskPublic]
+    next_cursor: str | None = None
 
 
 class TaskSoftUpdate(BaseModel):
@@ -110,3 +168,31 @@ class TaskSoftUpdate(BaseModel):
             return v.astimezone(ZoneInfo('America/Sao_Paulo'))
 
         return v.replace(tzinfo=ZoneInfo('America/Sao_Paulo'))
+
+
+class TaskBulkCreate(BaseModel):
+    tasks: list[TaskCreate] = Field(min_length=1, max_length=500)
+
+
+class TaskBulkUpdateItem(TaskSoftUpdate):
+    id: uuid.UUID
+
+
+class TaskBulkUpdate(BaseModel):
+    tasks: list[TaskBulkUpdateItem] = Field(min_length=1, max_length=500)
+
+
+class TaskBulkDelete(BaseModel):
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+
+
+class TaskBulkItemResult(BaseModel):
+    index: int
+    status_code: int
+    id: uuid.UUID | None = None
+    detail: str | None = None
+    task: TaskPublic | None = None
+
+
+class TaskBulkResult(BaseModel):
+    results: list[TaskBulkItemResult]
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,9 +9,44 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DATABASE_REPLICA_URL: str | None = None
+    READ_YOUR_WRITES_SECONDS: int = 5
+    FAST_JSON_RESPONSES: bool = False
+    EXPORT_YIELD_PER: int = 1000
+    # Length of one duration_estimate_blocks unit
+    SCHEDULE_BLOCK_MINUTES: int = 30
     CLERK_SECRET_KEY: str | None = None
     JWT_KEY: str | None = None
+    CLERK_JWKS_URL: str = 'https://api.clerk.com/v1/jwks'
+    JWKS_REFRESH_SECONDS: int = 3600
+    AUTH_AUTHORIZED_PARTIES: list[str] = [
+        'http://localhost:3000',
+        'http://127.0.0.1:3000',
+        'http://177.154.180.9:3000',
+    ]
+    AUTH_CLOCK_SKEW_SECONDS: int = 5
+    AUTH_TOKEN_CACHE_MAX_SIZE: int = 10000
+    USER_EMAIL_CACHE_MAX_SIZE: int = 1024
+    USER_EMAIL_CACHE_TTL_SECONDS: int = 300
     RABBITMQ_URL: str
+    RABBITMQ_CHANNEL_POOL_SIZE: int = 10
+    NOTIFICATION_BATCH_SIZE: int = 100
+    NOTIFICATION_BATCH_LINGER_MS: int = 50
+    NOTIFICATION_PUBLISH_RETRIES: int = 3
+    # 'legacy' until every consumer understands the v1 schema
+    NOTIFICATION_WIRE_FORMAT: Literal['legacy', 'v1'] = 'legacy'
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 100
+    NOTIFICATION_OUTBOX_POLL_SECONDS: int = 5
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = 5
+    SCHEDULER_BATCH_SIZE: int = 100
+    SCHEDULER_MAX_SLEEP_SECONDS: int = 30
+    SCHEDULER_LEADER_ELECTION: bool = True
+    SCHEDULER_LEADER_RETRY_SECONDS: int = 10
 
 
 settings = Settings()
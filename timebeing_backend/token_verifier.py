@@ -0,0 +1,129 @@
+import asyncio
+import math
+import re
+import time
+from datetime import timedelta
+from typing import Any
+
+import httpx
+import jwt
+from jwt.algorithms import RSAAlgorithm
+
+from .cache import AsyncTTLCache
+from .logger import logger
+from .settings import settings
+
+# Lower bound between JWKS fetches triggered by an unknown ``kid``
+JWKS_MIN_REFRESH_SECONDS = 60
+
+
+class TokenVerifier:
+    """
+    Verifies Clerk session tokens locally.
+
+    Verification keys are parsed once and kept in memory, either from the
+    static ``JWT_KEY`` PEM or from Clerk's JWKS (refreshed when stale or
+    when an unknown ``kid`` shows up). Verified tokens are cached until
+    their ``exp``, so a repeated bearer token costs a single dict lookup.
+    """
+
+    _algorithm = RSAAlgorithm(RSAAlgorithm.SHA256)
+
+    def __init__(self, jwt_key: str | None, secret_key: str | None):
+        self.secret_key = secret_key
+        self.jwks_url = settings.CLERK_JWKS_URL
+        self.jwks_refresh_seconds = settings.JWKS_REFRESH_SECONDS
+        self.authorized_parties = (
+            frozenset(settings.AUTH_AUTHORIZED_PARTIES)
+            if settings.AUTH_AUTHORIZED_PARTIES
+            else None
+        )
+        self.leeway = timedelta(seconds=settings.AUTH_CLOCK_SKEW_SECONDS)
+        self.tokens = AsyncTTLCache(
+            max_size=settings.AUTH_TOKEN_CACHE_MAX_SIZE, ttl=0
+        )
+
+        # Same normalisation Clerk applies to single-line PEM values
+        self._static_key = (
+            self._algorithm.prepare_key(re.sub(r'(\r\n|\n|\r)', '', jwt_key))
+            if jwt_key
+            else None
+        )
+        self._jwks: dict[str, Any] = {}
+        # monotonic() counts from boot, so any finite start could still be
+        # within JWKS_MIN_REFRESH_SECONDS of it on a fresh host
+        self._jwks_fetched_at = -math.inf
+        self._jwks_lock = asyncio.Lock()
+
+    async def verify(self, token: str) -> dict[str, Any]:
+        """
+        Verify a session token and return its claims.
+
+        Raises:
+            jwt.PyJWTError: If the token is malformed, expired, signed by
+            an unknown key or issued for another party
+        """
+        claims = self.tokens.get(token)
+        if claims is not None:
+            return claims
+
+        key = await self._resolve_key(token)
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=['RS256'],
+            options={'verify_iss': False, 'require': ['exp', 'sub']},
+            leeway=self.leeway,
+        )
+
+        # Like Clerk, only a token that names its party has it checked
+        azp = claims.get('azp')
+        if azp and self.authorized_parties is not None:
+            if azp not in self.authorized_parties:
+                raise jwt.InvalidTokenError('Invalid authorized party')
+
+        ttl = claims['exp'] - time.time()
+        if ttl > 0:
+            self.tokens.set(token, claims, ttl=ttl)
+
+        return claims
+
+    async def _resolve_key(self, token: str) -> Any:
+        if self._static_key is not None:
+            return self._static_key
+
+        kid = jwt.get_unverified_header(token).get('kid')
+        age = time.monotonic() - self._jwks_fetched_at
+
+        if age > self.jwks_refresh_seconds or (
+            kid not in self._jwks and age > JWKS_MIN_REFRESH_SECONDS
+        ):
+            await self._refresh_jwks()
+
+        key = self._jwks.get(kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f'Unknown signing key {kid}')
+
+        return key
+
+    async def _refresh_jwks(self):
+        fetched_at = self._jwks_fetched_at
+
+        async with self._jwks_lock:
+            # Another request refreshed the key set while we waited
+            if self._jwks_fetched_at != fetched_at:
+                return
+
+            logger.info('Atualizando JWKS do Clerk')
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    self.jwks_url,
+                    headers={'Authorization': f'Bearer {self.secret_key}'},
+                )
+                response.raise_for_status()
+
+            self._jwks = {
+                jwk['kid']: self._algorithm.from_jwk(jwk)
+                for jwk in response.json().get('keys', [])
+            }
+            self._jwks_fetched_at = time.monotonic()